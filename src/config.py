@@ -34,6 +34,12 @@ class Settings(BaseSettings):
     database_username: str
     database_password: str
     database_name: str
+    database_pool_size: int = Field(ge=1, default=10)
+    database_max_overflow: int = Field(ge=0, default=20)
+    database_query_cache_size: int = Field(ge=0, default=1200)
+    database_prepared_statement_cache_size: int = Field(ge=0, default=256)
+    database_project_cache_size: int = Field(ge=0, default=1024)
+    database_project_cache_ttl_seconds: float = Field(ge=0.0, default=60.0)
 
     generation_backend: str
     embedding_backend: str
@@ -45,16 +51,39 @@ class Settings(BaseSettings):
     generation_default_max_tokens: int = Field(ge=1, default=1024)
     generation_default_temperature: float = Field(ge=0.0, le=2.0, default=0.15)
     default_input_max_characters: int = Field(ge=1, default=3000)
+    embedding_batch_max_size: int = Field(ge=1, default=32)
+    embedding_batch_max_wait_ms: float = Field(ge=0.0, default=10.0)
+    embedding_batch_timeout_seconds: float = Field(gt=0.0, default=60.0)
 
     openai_api_key: str
     openai_api_base_url: Optional[str] = Field(default=None)
+    openai_timeout_seconds: float = Field(gt=0.0, default=600.0)
+
+    llm_http_max_connections: int = Field(ge=1, default=64)
+    llm_http_max_keepalive_connections: int = Field(ge=0, default=32)
 
     cohere_api_key: str
     cohere_api_base_url: Optional[str] = Field(default=None)
+    cohere_timeout_seconds: float = Field(gt=0.0, default=300.0)
 
     vectordb_backend: str
     vectordb_path: Path
+    vectordb_url: Optional[str] = Field(default=None)
+    vectordb_grpc_port: int = Field(ge=1, le=65535, default=6334)
+    vectordb_prefer_grpc: bool = Field(default=True)
+    vectordb_http_max_connections: int = Field(ge=1, default=100)
+    vectordb_http_max_keepalive_connections: int = Field(ge=0, default=32)
+    vectordb_timeout_seconds: int = Field(ge=1, default=30)
     vectordb_distance_metric: str
+    vectordb_scalar_quantization: bool = Field(default=True)
+    vectordb_indexing_threshold: int = Field(ge=0, default=20000)
+    vectordb_index_info_cache_ttl_seconds: float = Field(ge=0.0, default=30.0)
+    vectordb_index_info_cache_size: int = Field(ge=0, default=1024)
+    vectordb_index_list_cache_ttl_seconds: float = Field(ge=0.0, default=5.0)
+    vectordb_query_cache_ttl_seconds: float = Field(ge=0.0, default=300.0)
+    vectordb_query_cache_size: int = Field(ge=0, default=512)
+    vectordb_semantic_cache_bits: int = Field(ge=0, le=64, default=16)
+    vectordb_semantic_cache_threshold: float = Field(gt=0.0, le=1.0, default=0.95)
 
     primary_language: Locale
     fallback_language: Locale
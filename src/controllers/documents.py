@@ -2,6 +2,7 @@
 Controller for document-related operations.
 """
 
+import asyncio
 import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -83,13 +84,9 @@ class DocumentController(BaseController):
         parser = self._get_parser(filename)
         if parser:
             try:
-                blob = Blob.from_data(data=data, mime_type=content_type)
-                documents = parser.lazy_parse(blob)
-                file_texts = []
-                file_metadatas = []
-                for doc in documents:
-                    file_texts.append(self._cleanup_text(doc.page_content))
-                    file_metadatas.append(doc.metadata)
+                file_texts, file_metadatas = await asyncio.to_thread(
+                    self._parse_file, parser, data, content_type
+                )
                 if file_texts:
                     return file_texts, file_metadatas
             except Exception as e:
@@ -98,6 +95,29 @@ class DocumentController(BaseController):
                 )
         return None
 
+    def _parse_file(
+        self, parser: BaseBlobParser, data: bytes, content_type: str
+    ) -> Tuple[List[str], List[Dict]]:
+        """Parse the file data into cleaned text contents and metadata.
+
+        This is blocking work and is meant to run in a worker thread.
+
+        Args:
+            parser (BaseBlobParser): The document parser for the file type.
+            data (bytes): The file data.
+            content_type (str): The content type of the file.
+
+        Returns:
+            Tuple[List[str], List[Dict]]: The document text contents and their metadata.
+        """
+        blob = Blob.from_data(data=data, mime_type=content_type)
+        file_texts = []
+        file_metadatas = []
+        for doc in parser.lazy_parse(blob):
+            file_texts.append(self._cleanup_text(doc.page_content))
+            file_metadatas.append(doc.metadata)
+        return file_texts, file_metadatas
+
     def _cleanup_text(self, text: str) -> str:
         """Clean up the text by removing problematic characters.
 
@@ -138,8 +158,8 @@ class DocumentController(BaseController):
             splitter = RecursiveCharacterTextSplitter(
                 chunk_size=chunk_size, chunk_overlap=chunk_overlap
             )
-            chunks = splitter.create_documents(
-                texts=file_texts, metadatas=file_metadatas
+            chunks = await asyncio.to_thread(
+                splitter.create_documents, texts=file_texts, metadatas=file_metadatas
             )
             return chunks
         return None
@@ -2,15 +2,19 @@
 Controllers for managing Vector operations.
 """
 
-from typing import List, Optional
+import asyncio
+from typing import AsyncIterable, List, Optional, Sequence, Set
 from uuid import UUID
 
 from config import Settings
 from controllers.base import BaseController
+from llm.controllers.batching import EmbeddingBatcher
 from llm.models.base import LLMProviderInterface
 from llm.models.enums.inputs import InputType
 from models.chunk import DocumentChunk
 from models.vector import RetrievedDocumentChunk
+from utils.cache import TTLCache
+from utils.query_cache import QueryCache
 from vectordb.models import VectorDBProviderInterface
 
 
@@ -24,6 +28,9 @@ class VectorController(BaseController):
         settings: Settings,
         vectordb_client: VectorDBProviderInterface,
         embedding_model: LLMProviderInterface,
+        index_info_cache: Optional[TTLCache] = None,
+        query_cache: Optional[QueryCache] = None,
+        embedding_batcher: Optional[EmbeddingBatcher] = None,
     ):
         """Initialize the VectorController.
 
@@ -31,10 +38,19 @@ class VectorController(BaseController):
             settings (Settings): The application settings.
             vectordb_client (VectorDBProviderInterface): The vector database client.
             embedding_model (LLMProviderInterface): The LLM model to use for generating embeddings.
+            index_info_cache (Optional[TTLCache], optional): Cache for index points counts. \
+                Defaults to None.
+            query_cache (Optional[QueryCache], optional): Cache for query results. \
+                Defaults to None.
+            embedding_batcher (Optional[EmbeddingBatcher], optional): Batcher coalescing \
+                concurrent query embeddings. Defaults to None.
         """
         super().__init__(settings)
         self.vectordb_client = vectordb_client
         self.embedding_model = embedding_model
+        self.index_info_cache = index_info_cache
+        self.query_cache = query_cache
+        self.embedding_batcher = embedding_batcher
         self.logger.info("VectorController initialized")
 
     def _construct_index_name(self, project_id: UUID, embedding_size: int) -> str:
@@ -49,20 +65,31 @@ class VectorController(BaseController):
         """
         return f"index_{embedding_size}_{str(project_id)}"
 
-    async def create_index(self, project_id: UUID, replace: bool = False):
+    async def create_index(
+        self, project_id: UUID, replace: bool = False, bulk_load: bool = False
+    ) -> bool:
         """Create a new index for the given project ID.
 
         Args:
             project_id (UUID): The project ID.
             replace (bool): Whether to replace the existing index if it exists.
+            bulk_load (bool): Whether to defer building the search index until the \
+                bulk load is finalized. Defaults to False.
+
+        Returns:
+            bool: True if a new index was created, False if an existing one was kept.
         """
         index_name = self._construct_index_name(
             project_id, self.embedding_model.embedding_size_
         )
         self.logger.info("Creating index: %s", index_name)
+        self._invalidate_index_info(index_name)
 
-        await self.vectordb_client.create_index(
-            index_name, dimensions=self.embedding_model.embedding_size_, replace=replace
+        return await self.vectordb_client.create_index(
+            index_name,
+            dimensions=self.embedding_model.embedding_size_,
+            replace=replace,
+            bulk_load=bulk_load,
         )
 
     async def get_index_info(self, project_id: UUID):
@@ -81,6 +108,46 @@ class VectorController(BaseController):
 
         return await self.vectordb_client.get_index_info(index_name)
 
+    async def get_index_points_count(self, project_id: UUID) -> Optional[int]:
+        """Get the number of points in the index for the given project ID.
+
+        The count is served from the index info cache when available, falling back \
+            to the vector database on a miss.
+
+        Args:
+            project_id (UUID): The project ID.
+
+        Returns:
+            Optional[int]: The number of points in the index, or None if the index \
+                does not exist.
+        """
+        index_name = self._construct_index_name(
+            project_id, self.embedding_model.embedding_size_
+        )
+        if self.index_info_cache is not None:
+            points_count = self.index_info_cache.get(index_name)
+            if points_count is not None:
+                return points_count
+
+        index_info = await self.get_index_info(project_id=project_id)
+        if index_info is None:
+            return None
+        points_count = index_info.get("points_count") or 0
+        if self.index_info_cache is not None:
+            self.index_info_cache.set(index_name, points_count)
+        return points_count
+
+    def _invalidate_index_info(self, index_name: str):
+        """Drop any cached index info and query results for the given index.
+
+        Args:
+            index_name (str): The name of the index.
+        """
+        if self.index_info_cache is not None:
+            self.index_info_cache.pop(index_name)
+        if self.query_cache is not None:
+            self.query_cache.invalidate(index_name)
+
     def _normalize_vectors(self, vectors: List) -> List[List[float]]:
         """Normalize the vectors to ensure it is a list of lists.
 
@@ -119,27 +186,126 @@ class VectorController(BaseController):
         )
         self.logger.info("Querying vectors for project: '%s'...", str(project_id))
 
-        query_vector = await self.embedding_model.embed(
-            [query], input_type=InputType.QUERY
-        )
-        normalized_query_vector = self._normalize_vectors(query_vector)[0]
+        if self.query_cache is not None:
+            cached_vectors = self.query_cache.get(index_name, query, top_k, threshold)
+            if cached_vectors is not None:
+                self.logger.debug("Query cache hit for index: %s", index_name)
+                return cached_vectors
+
+        query_vector: List[float]
+        if self.embedding_batcher is not None:
+            query_vector = await self.embedding_batcher.embed(query)
+        else:
+            query_vector = self._normalize_vectors(
+                await self.embedding_model.embed([query], input_type=InputType.QUERY)
+            )[0]
+        if self.query_cache is not None:
+            cached_vectors = self.query_cache.get_similar(
+                index_name, query_vector, top_k, threshold
+            )
+            if cached_vectors is not None:
+                self.logger.debug("Semantic query cache hit for index: %s", index_name)
+                self.query_cache.set(
+                    index_name, query, top_k, threshold, cached_vectors
+                )
+                return cached_vectors
+
         relevant_vectors = await self.vectordb_client.query_vectors(
             index_name,
-            query_vector=normalized_query_vector,
+            query_vector=query_vector,
             top_k=top_k,
             threshold=threshold,
         )
+        if self.query_cache is not None and relevant_vectors:
+            self.query_cache.set(index_name, query, top_k, threshold, relevant_vectors)
+            self.query_cache.set_similar(
+                index_name, query_vector, top_k, threshold, relevant_vectors
+            )
         return relevant_vectors
 
+    async def _index_chunk_batch(
+        self,
+        index_name: str,
+        chunks: Sequence[DocumentChunk],
+        semaphore: asyncio.Semaphore,
+    ) -> bool:
+        """Embed a batch of chunks and insert them into the index, then release a slot.
+
+        Chunk IDs are used as record IDs, so re-indexing a chunk overwrites its vector \
+            instead of adding a duplicate.
+
+        Args:
+            index_name (str): The name of the index.
+            chunks (Sequence[DocumentChunk]): The document chunks to embed and insert.
+            semaphore (asyncio.Semaphore): The semaphore bounding in-flight batches; \
+                acquired by the caller and released here.
+
+        Returns:
+            bool: True if the batch was inserted successfully, False otherwise.
+        """
+        try:
+            texts = [chunk.content for chunk in chunks]
+            metadatas = [chunk.metadata_ for chunk in chunks]
+            for metadata, chunk in zip(metadatas, chunks):
+                metadata["chunk_asset"] = str(chunk.asset_id)
+                metadata["chunk_order"] = chunk.order
+            vectors = await self.embedding_model.embed(
+                texts, input_type=InputType.DOCUMENT
+            )
+            return await self.vectordb_client.insert_vectors(
+                index_name,
+                texts=texts,
+                vectors=self._normalize_vectors(vectors),
+                metadata=metadatas,
+                record_ids=[str(chunk.id) for chunk in chunks],
+                batch_size=len(texts),
+            )
+        except ValueError as e:
+            self.logger.error("Invalid vectors batch for index '%s': %s", index_name, e)
+            return False
+        finally:
+            semaphore.release()
+
+    def _collect_finished_batches(self, pending: Set[asyncio.Task]) -> bool:
+        """Remove finished batch tasks from the pending set and check their results.
+
+        Args:
+            pending (Set[asyncio.Task]): The in-flight batch tasks.
+
+        Returns:
+            bool: True if every finished batch was inserted successfully, False otherwise.
+        """
+        finished = {task for task in pending if task.done()}
+        pending.difference_update(finished)
+        return all([task.result() for task in finished])
+
     async def index_vectors(
-        self, project_id: UUID, chunks: List[DocumentChunk], reset: bool
+        self,
+        project_id: UUID,
+        chunk_pages: AsyncIterable[Sequence[DocumentChunk]],
+        reset: bool,
+        batch_size: int = 64,
+        max_concurrency: int = 4,
     ) -> bool:
         """Index the given vectors for the project ID.
 
+        Chunks are consumed page by page and split into batches; each batch is embedded \
+            and inserted as its own task, with up to `max_concurrency` batches in flight \
+            so embedding calls overlap with vector database inserts. Pages are only \
+            fetched once a slot is free and finished batches are released as they \
+            complete, so memory stays bounded by `max_concurrency` batches. Indexing \
+            stops at the first failed batch. A newly created index only builds its \
+            search index once all chunks are loaded.
+
         Args:
             project_id (UUID): The project ID.
-            chunks (List[DocumentChunk]): The document chunks to index.
+            chunk_pages (AsyncIterable[Sequence[DocumentChunk]]): The pages of document \
+                chunks to index.
             reset (bool): Whether to reset the index before adding new vectors.
+            batch_size (int, optional): The number of chunks per embedding call. \
+                Defaults to 64.
+            max_concurrency (int, optional): The maximum number of batches embedded or \
+                inserted at once. Defaults to 4.
 
         Returns:
             bool: True if indexing was successful, False otherwise.
@@ -147,32 +313,48 @@ class VectorController(BaseController):
         index_name = self._construct_index_name(
             project_id, self.embedding_model.embedding_size_
         )
-        self.logger.info(
-            "Indexing %d vectors for project: '%s'...", len(chunks), str(project_id)
+        self.logger.info("Indexing vectors for project: '%s'...", str(project_id))
+
+        bulk_loading = await self.create_index(
+            project_id, replace=reset, bulk_load=True
         )
 
-        await self.create_index(project_id, replace=reset)
-
-        texts = [chunk.content for chunk in chunks]
-        metadatas = [chunk.metadata_ for chunk in chunks]
-        for metadata, chunk in zip(metadatas, chunks):
-            metadata["chunk_asset"] = str(chunk.asset_id)
-            metadata["chunk_order"] = chunk.order
-        vectors = []
-        for i in range(0, len(texts), 64):
-            batch_texts = texts[i : i + 64]
-            batch_vectors = await self.embedding_model.embed(
-                batch_texts, input_type=InputType.DOCUMENT
-            )
-            vectors.extend(self._normalize_vectors(batch_vectors))
-        normalized_vectors = self._normalize_vectors(vectors)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        pending: Set[asyncio.Task] = set()
+        indexed_count = 0
+        inserted = True
+        try:
+            async for chunks in chunk_pages:
+                for i in range(0, len(chunks), batch_size):
+                    await semaphore.acquire()
+                    inserted = self._collect_finished_batches(pending)
+                    if not inserted:
+                        semaphore.release()
+                        break
+                    batch = chunks[i : i + batch_size]
+                    pending.add(
+                        asyncio.create_task(
+                            self._index_chunk_batch(index_name, batch, semaphore)
+                        )
+                    )
+                    indexed_count += len(batch)
+                if not inserted:
+                    break
+            if inserted:
+                inserted = all(await asyncio.gather(*pending))
+        finally:
+            for task in pending:
+                task.cancel()
+            if bulk_loading:
+                await self.vectordb_client.finalize_bulk_load(index_name)
+            self._invalidate_index_info(index_name)
 
-        return await self.vectordb_client.insert_vectors(
-            index_name,
-            texts=texts,
-            vectors=normalized_vectors,
-            metadata=metadatas,
+        if not inserted:
+            return False
+        self.logger.info(
+            "Indexed %d vectors for project: '%s'", indexed_count, str(project_id)
         )
+        return True
 
     async def delete_index(self, project_id: UUID):
         """Delete the index for the given project ID.
@@ -184,6 +366,7 @@ class VectorController(BaseController):
             project_id, self.embedding_model.embedding_size_
         )
         self.logger.info("Deleting index: %s", index_name)
+        self._invalidate_index_info(index_name)
         try:
             await self.vectordb_client.delete_index(index_name)
         except Exception as e:
@@ -3,14 +3,23 @@ Dependencies for the application.
 """
 
 import logging
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, Type, TypeVar
 
 from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
 )
 
+from controllers.vectors import VectorController
+from utils.cache import TTLCache
+
+logger = logging.getLogger("dependencies")
+
+RequestModelT = TypeVar("RequestModelT", bound=BaseModel)
+
 
 async def get_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """Get a database session from the request state.
@@ -21,7 +30,6 @@ async def get_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
     Returns:
         AsyncGenerator[AsyncSession, None]: The database session.
     """
-    logger = logging.getLogger("dependencies")
     Session: async_sessionmaker = request.app.state.async_session
     async with Session() as session:
         try:
@@ -36,3 +44,80 @@ async def get_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
                 str(e),
             )
             await session.rollback()
+
+
+def get_vector_controller(request: Request) -> VectorController:
+    """Get the shared vector controller from the application state.
+
+    Args:
+        request (Request): The FastAPI request object.
+
+    Returns:
+        VectorController: The vector controller.
+    """
+    return request.app.state.vector_controller
+
+
+def get_project_cache(request: Request) -> TTLCache:
+    """Get the shared cache of known project IDs from the application state.
+
+    Args:
+        request (Request): The FastAPI request object.
+
+    Returns:
+        TTLCache: The project cache.
+    """
+    return request.app.state.project_cache
+
+
+def json_body(
+    model: Type[RequestModelT],
+) -> Callable[[Request], Awaitable[RequestModelT]]:
+    """Build a dependency that validates the raw JSON request body against a model.
+
+    The model's TypeAdapter is built once, and the body bytes are validated directly \
+        with `validate_json`, skipping FastAPI's decode-then-validate body handling.
+
+    Args:
+        model (Type[RequestModelT]): The request schema.
+
+    Returns:
+        Callable[[Request], Awaitable[RequestModelT]]: The body dependency.
+    """
+    adapter = TypeAdapter(model)
+
+    async def parse_body(request: Request) -> RequestModelT:
+        try:
+            return adapter.validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError(
+                [
+                    {**error, "loc": ("body", *error["loc"])}
+                    for error in e.errors(include_url=False)
+                ]
+            ) from e
+
+    return parse_body
+
+
+def json_body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Build the OpenAPI request body description for a `json_body` dependency.
+
+    Args:
+        model (Type[BaseModel]): The request schema.
+
+    Returns:
+        Dict[str, Any]: The `openapi_extra` entry documenting the request body.
+    """
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": model.model_json_schema(
+                        ref_template="#/components/schemas/{model}"
+                    )
+                }
+            },
+        }
+    }
@@ -2,4 +2,5 @@
 LLM controllers for Lite-RAG-App
 """
 
+from llm.controllers.batching import EmbeddingBatcher
 from llm.controllers.factory import LLMProviderFactory
@@ -0,0 +1,173 @@
+"""
+Batching of concurrent embedding requests for Lite-RAG-App
+"""
+
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+
+from llm.models.base import LLMProviderInterface
+from llm.models.enums.inputs import InputType
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent query embedding requests into batched embedding calls.
+
+    Requests are queued and a background worker drains the queue whenever the batch \
+        is full or the batching window elapses, embedding all queued texts at once.
+    """
+
+    def __init__(
+        self,
+        embedding_model: LLMProviderInterface,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 10.0,
+        timeout_seconds: float = 60.0,
+    ):
+        """Initialize the EmbeddingBatcher.
+
+        Args:
+            embedding_model (LLMProviderInterface): The LLM model to use for generating embeddings.
+            max_batch_size (int, optional): The maximum number of texts per embedding call. \
+                Defaults to 32.
+            max_wait_ms (float, optional): How long to wait for more requests after the \
+                first one is queued, in milliseconds. Defaults to 10.0.
+            timeout_seconds (float, optional): How long a request waits for its \
+                embedding, in seconds. Defaults to 60.0.
+        """
+        self.embedding_model = embedding_model
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_ms / 1000
+        self.timeout_seconds = timeout_seconds
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._queue: Optional[asyncio.Queue[Tuple[str, asyncio.Future]]] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._in_flight: List[Tuple[str, asyncio.Future]] = []
+
+    def start(self):
+        """Start the background batching worker on the running event loop."""
+        if self._worker is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+        self.logger.info(
+            "EmbeddingBatcher started (max_batch_size=%d, max_wait_ms=%.1f)",
+            self.max_batch_size,
+            self.max_wait_seconds * 1000,
+        )
+
+    async def stop(self):
+        """Stop the background worker and fail any requests still in flight or queued."""
+        if self._worker is None or self._queue is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            # Already logged by the worker when it died
+            pass
+        self._fail_pending(RuntimeError("EmbeddingBatcher stopped"))
+        self._worker = None
+        self._queue = None
+        self.logger.info("EmbeddingBatcher stopped")
+
+    async def embed(self, text: str) -> List[float]:
+        """Embed a single query text as part of the next batch.
+
+        Falls back to a direct embedding call if the worker is not running.
+
+        Args:
+            text (str): The query text to embed.
+
+        Returns:
+            List[float]: The query embedding.
+
+        Raises:
+            asyncio.TimeoutError: If the embedding is not ready within the timeout.
+        """
+        if self._queue is None or self._worker is None or self._worker.done():
+            embeddings = await self.embedding_model.embed(
+                [text], input_type=InputType.QUERY
+            )
+            return embeddings[0] if embeddings else []
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await asyncio.wait_for(future, self.timeout_seconds)
+
+    def _fail_pending(self, error: Exception):
+        """Fail the requests of the in-flight batch and any requests still queued.
+
+        Args:
+            error (Exception): The error to fail the requests with.
+        """
+        pending = self._in_flight
+        self._in_flight = []
+        if self._queue is not None:
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(error)
+
+    async def _collect_batch(self) -> List[Tuple[str, asyncio.Future]]:
+        """Wait for the next request and gather more until the batch is full or the window ends.
+
+        Returns:
+            List[Tuple[str, asyncio.Future]]: The queued texts and their futures.
+        """
+        assert self._queue is not None
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait_seconds
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        """Drain the queue in batches until cancelled.
+
+        Requests of the in-flight batch and the queue are failed if the worker is \
+            cancelled or dies, so no caller is left waiting.
+        """
+        try:
+            while True:
+                batch = await self._collect_batch()
+                self._in_flight = batch
+                texts = [text for text, _ in batch]
+                try:
+                    embeddings = await self.embedding_model.embed(
+                        texts, input_type=InputType.QUERY
+                    )
+                except Exception as e:
+                    self.logger.error(
+                        "Failed to embed batch of %d queries: %s", len(texts), str(e)
+                    )
+                    self._in_flight = []
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+
+                self.logger.debug("Embedded batch of %d queries", len(texts))
+                for idx, (_, future) in enumerate(batch):
+                    if not future.done():
+                        future.set_result(
+                            embeddings[idx] if idx < len(embeddings) else []
+                        )
+                self._in_flight = []
+        except asyncio.CancelledError:
+            self._fail_pending(RuntimeError("EmbeddingBatcher stopped"))
+            raise
+        except Exception:
+            self.logger.exception("EmbeddingBatcher worker died")
+            self._fail_pending(RuntimeError("EmbeddingBatcher worker died"))
+            raise
@@ -5,6 +5,8 @@ Factory class for creating LLM Provider instances.
 import logging
 from typing import Optional
 
+import httpx
+
 from config import Settings
 from llm.models.base import LLMProviderInterface
 from llm.models.enums.providers import LLMProvider
@@ -23,6 +25,25 @@ class LLMProviderFactory:
         self.base_url: Optional[str] = None
         self.logger = logging.getLogger(self.__class__.__name__)
 
+    def _create_http_client(self, timeout: httpx.Timeout) -> httpx.AsyncClient:
+        """Create the pooled HTTP client a provider reuses for all of its API calls.
+
+        Args:
+            timeout (httpx.Timeout): The request timeout; the SDKs read their own \
+                timeout from the injected client, so it must match each SDK's default.
+
+        Returns:
+            httpx.AsyncClient: The HTTP client.
+        """
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.settings.llm_http_max_connections,
+                max_keepalive_connections=self.settings.llm_http_max_keepalive_connections,
+            ),
+            timeout=timeout,
+            follow_redirects=True,
+        )
+
     def create(self, provider_type: str, **kwargs) -> Optional[LLMProviderInterface]:
         """
         Create a new LLM Provider instance.
@@ -43,6 +64,9 @@ class LLMProviderFactory:
                 max_input_characters=self.settings.default_input_max_characters,
                 default_max_output_tokens=self.settings.generation_default_max_tokens,
                 default_temperature=self.settings.generation_default_temperature,
+                http_client=self._create_http_client(
+                    httpx.Timeout(self.settings.openai_timeout_seconds, connect=5.0)
+                ),
                 **kwargs,
             )
             return openai_provider
@@ -55,6 +79,9 @@ class LLMProviderFactory:
                 max_input_characters=self.settings.default_input_max_characters,
                 default_max_output_tokens=self.settings.generation_default_max_tokens,
                 default_temperature=self.settings.generation_default_temperature,
+                http_client=self._create_http_client(
+                    httpx.Timeout(self.settings.cohere_timeout_seconds)
+                ),
                 **kwargs,
             )
             return cohere_provider
@@ -3,6 +3,7 @@ Controllers for managing templates in the LLM application.
 """
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 from string import Template
 from typing import Any, Dict, Optional
@@ -79,6 +80,33 @@ class TemplateController:
         Returns:
             Optional[str]: The rendered template string, or None if not found.
         """
+        template = self.load_template(group, key, locale=locale)
+        if template is None:
+            return None
+
+        return template.substitute(variables) if variables else template.template
+
+    @lru_cache(maxsize=256)
+    def load_template(
+        self,
+        group: str,
+        key: str,
+        locale: Optional[Locale] = None,
+    ) -> Optional[Template]:
+        """
+        Load a template object based on locale, group, and key.
+
+        Lookups are cached, so each template is resolved only once per controller.
+
+        Args:
+            group (str): The group the template belongs to.
+            key (str): The key of the template.
+            locale (Locale): The locale to retrieve the template for. Optional; \
+                defaults to primary language.
+
+        Returns:
+            Optional[Template]: The template object, or None if not found.
+        """
         if locale is None:
             locale = self.primary_lang
         locale_dir = self._get_locale_dir(locale)
@@ -101,4 +129,4 @@ class TemplateController:
             self.logger.warning("Template key '%s' not found in %s", key, template_path)
             return None
 
-        return template.substitute(variables) if variables else template.template
+        return template
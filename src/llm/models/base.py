@@ -6,6 +6,8 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
 
+import httpx
+
 from llm.models.enums.inputs import InputType
 
 
@@ -102,6 +104,10 @@ class LLMProviderInterface(ABC):
             Optional[str]: The generated response if available.
         """
 
+    @abstractmethod
+    async def close(self):
+        """Release the provider's network resources."""
+
 
 class BaseLLMProvider(LLMProviderInterface):
     """
@@ -113,9 +119,11 @@ class BaseLLMProvider(LLMProviderInterface):
         max_input_characters: int = 3000,
         default_max_output_tokens: int = 1024,
         default_temperature: float = 0.15,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         self.api_key: Optional[str] = None
         self.base_url: Optional[str] = None
+        self.http_client = http_client
 
         self.max_input_characters = max_input_characters
         self.default_max_output_tokens = default_max_output_tokens
@@ -128,6 +136,12 @@ class BaseLLMProvider(LLMProviderInterface):
 
         self.logger = logging.getLogger(self.__class__.__name__)
 
+    async def close(self):
+        """Close the pooled HTTP client shared by the provider's API calls, if any."""
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
+
     async def set_generation_model(self, model_id: str):
         """Set the generation model to use for responses.
 
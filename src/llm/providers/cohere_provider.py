@@ -5,6 +5,7 @@ Concrete implementation of the Cohere LLM provider.
 from enum import Enum
 from typing import Dict, List, Optional
 
+import httpx
 from cohere import AsyncClientV2
 
 from llm.models.base import BaseLLMProvider
@@ -36,17 +37,22 @@ class CohereProvider(BaseLLMProvider):
         max_input_characters: int = 3000,
         default_max_output_tokens: int = 1024,
         default_temperature: float = 0.15,
+        http_client: Optional[httpx.AsyncClient] = None,
         **kwargs,
     ):
         super().__init__(
             max_input_characters,
             default_max_output_tokens,
             default_temperature,
+            http_client=http_client,
         )
         self.api_key = api_key
         self.base_url = base_url if base_url else None
         self.client = AsyncClientV2(
-            api_key=self.api_key, base_url=self.base_url, **kwargs
+            api_key=self.api_key,
+            base_url=self.base_url,
+            httpx_client=self.http_client,
+            **kwargs,
         )
         self.enums = CohereMessageRoles
         self.available_models: List[str] = []
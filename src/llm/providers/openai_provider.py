@@ -5,6 +5,7 @@ Concrete implementation of the OpenAI LLM provider.
 from enum import Enum
 from typing import Dict, List, Optional
 
+import httpx
 from openai import AsyncOpenAI
 
 from llm.models.base import BaseLLMProvider
@@ -31,17 +32,22 @@ class OpenAIProvider(BaseLLMProvider):
         max_input_characters: int = 3000,
         default_max_output_tokens: int = 1024,
         default_temperature: float = 0.15,
+        http_client: Optional[httpx.AsyncClient] = None,
         **kwargs,
     ):
         super().__init__(
             max_input_characters,
             default_max_output_tokens,
             default_temperature,
+            http_client=http_client,
         )
         self.api_key = api_key
         self.base_url = base_url
         self.client = AsyncOpenAI(
-            api_key=self.api_key, base_url=self.base_url, **kwargs
+            api_key=self.api_key,
+            base_url=self.base_url,
+            http_client=self.http_client,
+            **kwargs,
         )
         self.enums = OpenAIMessageRoles
         self.available_models: List[str] = []
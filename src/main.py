@@ -9,7 +9,8 @@ from sqlalchemy.engine import URL
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from config import get_settings, setup_logging
-from llm.controllers.factory import LLMProviderFactory
+from controllers.vectors import VectorController
+from llm.controllers import EmbeddingBatcher, LLMProviderFactory
 from llm.controllers.templates import TemplateController
 from routes.assets import assets_router
 from routes.base import base_router
@@ -17,6 +18,7 @@ from routes.documents import document_router
 from routes.projects import projects_router
 from routes.rag import rag_router
 from routes.vectors import vector_router
+from utils import QueryCache, TTLCache
 from vectordb import VectorDBProviderFactory
 
 
@@ -38,9 +40,17 @@ async def lifespan(fastapi_app: FastAPI):
         host=fastapi_app.state.settings.database_hostname,
         port=fastapi_app.state.settings.database_port,
         database=fastapi_app.state.settings.database_name,
+        query={
+            "prepared_statement_cache_size": str(
+                fastapi_app.state.settings.database_prepared_statement_cache_size
+            )
+        },
     )
     fastapi_app.state.engine = create_async_engine(
         db_url.render_as_string(hide_password=False),
+        pool_size=fastapi_app.state.settings.database_pool_size,
+        max_overflow=fastapi_app.state.settings.database_max_overflow,
+        query_cache_size=fastapi_app.state.settings.database_query_cache_size,
     )
     fastapi_app.state.async_session = async_sessionmaker(
         bind=fastapi_app.state.engine,
@@ -57,6 +67,17 @@ async def lifespan(fastapi_app: FastAPI):
             fastapi_app.state.settings.embedding_model_id,
             fastapi_app.state.settings.embedding_dimensions,
         )
+    fastapi_app.state.embedding_batcher = None
+    if fastapi_app.state.embedding_llm is not None:
+        fastapi_app.state.embedding_batcher = EmbeddingBatcher(
+            fastapi_app.state.embedding_llm,
+            max_batch_size=fastapi_app.state.settings.embedding_batch_max_size,
+            max_wait_ms=fastapi_app.state.settings.embedding_batch_max_wait_ms,
+            timeout_seconds=(
+                fastapi_app.state.settings.embedding_batch_timeout_seconds
+            ),
+        )
+        fastapi_app.state.embedding_batcher.start()
     fastapi_app.state.generation_llm = llm_factory.create(
         provider_type=fastapi_app.state.settings.generation_backend
     )
@@ -72,6 +93,29 @@ async def lifespan(fastapi_app: FastAPI):
     if fastapi_app.state.vectordb_client is not None:
         await fastapi_app.state.vectordb_client.connect()
 
+    fastapi_app.state.project_cache = TTLCache(
+        maxsize=fastapi_app.state.settings.database_project_cache_size,
+        ttl_seconds=fastapi_app.state.settings.database_project_cache_ttl_seconds,
+    )
+    fastapi_app.state.index_info_cache = TTLCache(
+        maxsize=fastapi_app.state.settings.vectordb_index_info_cache_size,
+        ttl_seconds=fastapi_app.state.settings.vectordb_index_info_cache_ttl_seconds,
+    )
+    fastapi_app.state.query_cache = QueryCache(
+        maxsize=fastapi_app.state.settings.vectordb_query_cache_size,
+        ttl_seconds=fastapi_app.state.settings.vectordb_query_cache_ttl_seconds,
+        semantic_bits=fastapi_app.state.settings.vectordb_semantic_cache_bits,
+        semantic_threshold=fastapi_app.state.settings.vectordb_semantic_cache_threshold,
+    )
+    fastapi_app.state.vector_controller = VectorController(
+        settings=fastapi_app.state.settings,
+        vectordb_client=fastapi_app.state.vectordb_client,
+        embedding_model=fastapi_app.state.embedding_llm,
+        index_info_cache=fastapi_app.state.index_info_cache,
+        query_cache=fastapi_app.state.query_cache,
+        embedding_batcher=fastapi_app.state.embedding_batcher,
+    )
+
     fastapi_app.state.template_controller = TemplateController(
         primary_lang=fastapi_app.state.settings.primary_language,
         fallback_lang=fastapi_app.state.settings.fallback_language,
@@ -79,7 +123,13 @@ async def lifespan(fastapi_app: FastAPI):
 
     yield
 
+    if fastapi_app.state.embedding_batcher is not None:
+        await fastapi_app.state.embedding_batcher.stop()
     await fastapi_app.state.engine.dispose()
+    if fastapi_app.state.embedding_llm is not None:
+        await fastapi_app.state.embedding_llm.close()
+    if fastapi_app.state.generation_llm is not None:
+        await fastapi_app.state.generation_llm.close()
     if fastapi_app.state.vectordb_client is not None:
         await fastapi_app.state.vectordb_client.disconnect()
 
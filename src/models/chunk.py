@@ -2,7 +2,7 @@
 Model definition for a document chunk.
 """
 
-from typing import List, Optional, Sequence
+from typing import AsyncGenerator, List, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import delete, select
@@ -90,6 +90,37 @@ class DocumentChunkModel(BaseDataModel):
         chunks = result.scalars().all()
         return chunks
 
+    async def iter_chunk_pages_by_project(
+        self, project_id: UUID, page_size: int = 64
+    ) -> AsyncGenerator[Sequence[DocumentChunk], None]:
+        """Iterate over the document chunks of a project page by page.
+
+        Pages are fetched with keyset pagination on the chunk ID, so each page costs \
+            the same regardless of its position and only one page is held at a time.
+
+        Args:
+            project_id (UUID): The ID of the project.
+            page_size (int): The maximum number of chunks per page. Defaults to 64.
+
+        Yields:
+            Sequence[DocumentChunk]: The next page of document chunks.
+        """
+        last_id: Optional[UUID] = None
+        while True:
+            query = select(DocumentChunk).where(DocumentChunk.project_id == project_id)
+            if last_id is not None:
+                query = query.where(DocumentChunk.id > last_id)
+            result = await self.db_session.execute(
+                query.order_by(DocumentChunk.id).limit(page_size)
+            )
+            chunks = result.scalars().all()
+            if not chunks:
+                return
+            yield chunks
+            if len(chunks) < page_size:
+                return
+            last_id = chunks[-1].id
+
     async def delete_chunks_by_project_asset(
         self, project_id: UUID, asset_id: UUID
     ) -> int:
@@ -2,15 +2,16 @@
 Model definitions for projects.
 """
 
-from typing import Optional, Sequence
+from typing import List, Optional, Sequence, Tuple
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import functions
 
-from databases.lite_rag.schemas import Project
+from databases.lite_rag.schemas import DocumentChunk, Project
 from models.base import BaseDataModel
+from utils.cache import TTLCache
 
 
 class ProjectModel(BaseDataModel):
@@ -18,13 +19,18 @@ class ProjectModel(BaseDataModel):
     Model for the Project entity.
     """
 
-    def __init__(self, db_session: AsyncSession):
+    def __init__(
+        self, db_session: AsyncSession, project_cache: Optional[TTLCache] = None
+    ):
         """Initialize the Project model.
 
         Args:
             db_session (AsyncSession): The SQLAlchemy database async session.
+            project_cache (Optional[TTLCache], optional): Cache of project IDs known \
+                to exist. Defaults to None.
         """
         super().__init__(db_session)
+        self.project_cache = project_cache
         self.logger.info("ProjectModel initialized")
 
     async def insert_project(self, project: Project) -> Optional[Project]:
@@ -62,6 +68,32 @@ class ProjectModel(BaseDataModel):
         projects = result.scalars().all()
         return projects
 
+    async def get_projects_with_total(
+        self, skip: int = 0, limit: int = 10
+    ) -> Tuple[List[Project], int]:
+        """Get a page of projects together with the total number of projects.
+
+        The total is computed with a window function in the same query; a separate \
+            count is only issued when the requested page is empty.
+
+        Args:
+            skip (int, optional): The number of projects to skip. Defaults to 0.
+            limit (int, optional): The maximum number of projects to return. Defaults to 10.
+
+        Returns:
+            Tuple[List[Project], int]: The list of projects and the total number of projects.
+        """
+        result = await self.db_session.execute(
+            select(Project, functions.count().over().label("total"))
+            .offset(skip)
+            .limit(limit)
+        )
+        rows = result.all()
+        if not rows:
+            return [], await self.count_projects()
+        projects = [row.Project for row in rows]
+        return projects, rows[0].total
+
     async def get_project_by_id(self, project_id: UUID) -> Optional[Project]:
         """Get a project by its ID from the database.
 
@@ -77,6 +109,42 @@ class ProjectModel(BaseDataModel):
         project = result.scalar_one_or_none()
         return project
 
+    async def project_has_chunks(self, project_id: UUID) -> Optional[bool]:
+        """Check in a single query whether a project exists and has document chunks.
+
+        Args:
+            project_id (UUID): The ID of the project.
+
+        Returns:
+            Optional[bool]: Whether the project has any document chunks, \
+                or None if the project does not exist.
+        """
+        has_chunks = exists().where(DocumentChunk.project_id == Project.id)
+        result = await self.db_session.execute(
+            select(has_chunks).where(Project.id == project_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def project_exists(self, project_id: UUID) -> bool:
+        """Check whether a project exists, serving recent positive answers from the \
+            project cache when one is set.
+
+        Args:
+            project_id (UUID): The ID of the project.
+
+        Returns:
+            bool: True if the project exists, False otherwise.
+        """
+        if self.project_cache is not None and self.project_cache.get(project_id):
+            return True
+        result = await self.db_session.execute(
+            select(Project.id).where(Project.id == project_id)
+        )
+        project_found = result.scalar_one_or_none() is not None
+        if project_found and self.project_cache is not None:
+            self.project_cache.set(project_id, True)
+        return project_found
+
     async def delete_project(self, project_id: UUID) -> bool:
         """Delete a project by its ID from the database and its associated data.
 
@@ -91,6 +159,8 @@ class ProjectModel(BaseDataModel):
                 Project.id == project_id,
             )
         )
+        if self.project_cache is not None:
+            self.project_cache.pop(project_id)
         deleted_count = result.rowcount or 0
         return deleted_count > 0
 
@@ -20,4 +20,4 @@ class RetrievedDocumentChunk(BaseModel):
         description="The relevance score of the document chunk in case of similarity search",
     )
 
-    model_config = ConfigDict(arbitrary_types_allowed=True, extra="ignore")
+    model_config = ConfigDict(frozen=True, extra="ignore")
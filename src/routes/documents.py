@@ -10,11 +10,12 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from controllers import DocumentController, VectorController
-from dependencies import get_session
+from dependencies import get_session, get_vector_controller
 from models.asset import AssetModel
 from models.chunk import DocumentChunk, DocumentChunkModel
 from models.enums import ResponseSignals
 from models.project import ProjectModel
+from routes.responses import model_response
 from routes.schemas import (
     BatchDocumentsResponse,
     ChunkListResponse,
@@ -113,11 +114,12 @@ async def process_document(
         len(records),
     )
 
-    return {
-        "values": records,
-        "count": len(records),
-        "total": len(records),
-    }
+    return model_response(
+        ChunkListResponse.model_validate(
+            {"values": records, "count": len(records), "total": len(records)}
+        ),
+        status.HTTP_201_CREATED,
+    )
 
 
 @document_router.post(
@@ -132,6 +134,7 @@ async def refresh_project_documents(
     project_id: UUID,
     refresh_request: ProjectDocumentsRefreshRequest,
     db_session: AsyncSession = Depends(get_session),
+    vector_controller: VectorController = Depends(get_vector_controller),
 ):
     """
     Refreshes all documents for a specific project by removing old chunks and reprocessing them.
@@ -165,11 +168,6 @@ async def refresh_project_documents(
 
     document_chunk_model = DocumentChunkModel(db_session)
     if refresh_request.replace_existing:
-        vector_controller = VectorController(
-            settings=settings,
-            vectordb_client=request.app.state.vectordb_client,
-            embedding_model=request.app.state.embedding_llm,
-        )
         await vector_controller.delete_index(project_record.id)
         deleted_count = await document_chunk_model.delete_chunks_by_project(
             project_record.id
@@ -227,13 +225,18 @@ async def refresh_project_documents(
             "total": len(records),
         }
 
-    return {
-        "values": results,
-        "count": sum(
-            1 for v in results.values() if isinstance(v, dict) and "values" in v
+    return model_response(
+        BatchDocumentsResponse.model_validate(
+            {
+                "values": results,
+                "count": sum(
+                    1 for v in results.values() if isinstance(v, dict) and "values" in v
+                ),
+                "total": len(results),
+            }
         ),
-        "total": len(results),
-    }
+        status.HTTP_201_CREATED,
+    )
 
 
 @document_router.get(
@@ -290,11 +293,12 @@ async def list_document_chunks(
             content={"msg": ResponseSignals.CHUNK_NOT_FOUND.value},
         )
 
-    return {
-        "values": page,
-        "count": len(page),
-        "total": len(chunks),
-    }
+    return model_response(
+        ChunkListResponse.model_validate(
+            {"values": page, "count": len(page), "total": len(chunks)}
+        ),
+        status.HTTP_200_OK,
+    )
 
 
 @document_router.delete("/{file_id}", status_code=status.HTTP_204_NO_CONTENT)
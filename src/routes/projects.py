@@ -5,11 +5,16 @@ Projects API routes for Lite-RAG-App
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from dependencies import get_session
+from controllers.vectors import VectorController
+from dependencies import (
+    get_project_cache,
+    get_session,
+    get_vector_controller,
+)
 from models.enums import ResponseSignals
 from models.project import Project, ProjectModel
 from routes.schemas import (
@@ -17,8 +22,13 @@ from routes.schemas import (
     ProjectListResponse,
     ProjectResponse,
 )
+from utils.cache import TTLCache
 
-projects_router = APIRouter(prefix="/api/v1/projects", tags=["projects", "v1"])
+projects_router = APIRouter(
+    prefix="/api/v1/projects",
+    tags=["projects", "v1"],
+    default_response_class=ORJSONResponse,
+)
 
 
 @projects_router.post(
@@ -41,7 +51,7 @@ async def create_project(
     )
 
     if not project_record:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={"msg": ResponseSignals.PROJECT_CREATION_FAILED.value},
         )
@@ -64,13 +74,17 @@ async def list_projects(
     if limit > 100:
         limit = 100
     project_model = ProjectModel(db_session)
-    projects = await project_model.get_projects(skip=skip, limit=limit)
-    total = await project_model.count_projects()
-    return {
-        "values": projects,
-        "count": len(projects),
-        "total": total,
-    }
+    projects, total = await project_model.get_projects_with_total(
+        skip=skip, limit=limit
+    )
+    project_list = ProjectListResponse.model_validate(
+        {"values": projects, "count": len(projects), "total": total}
+    )
+    return ORJSONResponse(
+        content=project_list.model_dump(
+            mode="json", exclude_unset=True, exclude_none=True
+        ),
+    )
 
 
 @projects_router.get(
@@ -89,25 +103,38 @@ async def get_project(
     project_model = ProjectModel(db_session)
     project = await project_model.get_project_by_id(project_id)
     if not project:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"msg": ResponseSignals.PROJECT_NOT_FOUND.value},
         )
     return {"value": project}
 
 
-@projects_router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
+@projects_router.delete(
+    "/{project_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
+    response_model=None,
+)
 async def delete_project(
-    project_id: UUID, db_session: AsyncSession = Depends(get_session)
+    project_id: UUID,
+    background_tasks: BackgroundTasks,
+    db_session: AsyncSession = Depends(get_session),
+    vector_controller: VectorController = Depends(get_vector_controller),
+    project_cache: TTLCache = Depends(get_project_cache),
 ):
     """
     Deletes a specific project by its ID.
+
+    The project's vector index is dropped in the background after the response is sent.
     """
-    project_model = ProjectModel(db_session)
+    project_model = ProjectModel(db_session, project_cache=project_cache)
     deleted = await project_model.delete_project(project_id)
     if not deleted:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"msg": ResponseSignals.PROJECT_NOT_FOUND.value},
         )
-    return
+
+    background_tasks.add_task(vector_controller.delete_index, project_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -2,29 +2,52 @@
 API routes for RAG-related operations.
 """
 
+import asyncio
+from io import StringIO
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from controllers.rag import RAGController
 from controllers.vectors import VectorController
-from dependencies import get_session
+from dependencies import (
+    get_project_cache,
+    get_session,
+    get_vector_controller,
+    json_body,
+    json_body_openapi,
+)
 from llm.controllers.templates import TemplateController
 from models.enums.responses import ResponseSignals
 from models.project import ProjectModel
-from routes.schemas.rag import RAGQueryRequest, RAGQueryResponse
-
-rag_router = APIRouter(prefix="/api/v1/p/{project_id}/rag", tags=["rag", "v1"])
-
-
-@rag_router.post("/generate", response_model=RAGQueryResponse)
+from routes.schemas import (
+    RETRIEVED_CHUNKS_ADAPTER,
+    RAGQueryRequest,
+    RAGQueryResponse,
+)
+from utils.cache import TTLCache
+
+rag_router = APIRouter(
+    prefix="/api/v1/p/{project_id}/rag",
+    tags=["rag", "v1"],
+    default_response_class=ORJSONResponse,
+)
+
+
+@rag_router.post(
+    "/generate",
+    response_model=RAGQueryResponse,
+    openapi_extra=json_body_openapi(RAGQueryRequest),
+)
 async def generate_with_rag(
     request: Request,
     project_id: UUID,
-    rag_request: RAGQueryRequest,
+    rag_request: RAGQueryRequest = Depends(json_body(RAGQueryRequest)),
     db_session: AsyncSession = Depends(get_session),
+    vector_controller: VectorController = Depends(get_vector_controller),
+    project_cache: TTLCache = Depends(get_project_cache),
 ):
     """Generate a response using RAG.
 
@@ -36,28 +59,52 @@ async def generate_with_rag(
     Returns:
         RAGQueryResponse: The RAG query response.
     """
-    settings = request.app.state.settings
-    project_model = ProjectModel(db_session)
-    project_record = await project_model.get_project_by_id(project_id)
-    if project_record is None:
-        return JSONResponse(
-            status_code=status.HTTP_404_NOT_FOUND,
-            content={"msg": ResponseSignals.PROJECT_NOT_FOUND.value},
+    state = request.app.state
+    settings = state.settings
+    template_controller: TemplateController = state.template_controller
+    system_prompt = template_controller.get_template("rag", "SYSTEM_PROMPT")
+    context_template = template_controller.load_template("rag", "CONTEXT_ENTRY")
+    footer = template_controller.get_template(
+        "rag",
+        "FOOTER",
+        variables={"query": rag_request.query},
+    )
+    if system_prompt is None or context_template is None or footer is None:
+        missing_templates = [
+            key
+            for key, template in (
+                ("SYSTEM_PROMPT", system_prompt),
+                ("CONTEXT_ENTRY", context_template),
+                ("FOOTER", footer),
+            )
+            if template is None
+        ]
+        template_controller.logger.error(
+            "RAG request failed; Missing RAG templates: %s",
+            ", ".join(missing_templates),
+        )
+        return ORJSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content={"msg": ResponseSignals.RAG_GENERATION_FAILED.value},
         )
 
-    vector_controller = VectorController(
-        settings=settings,
-        vectordb_client=request.app.state.vectordb_client,
-        embedding_model=request.app.state.embedding_llm,
+    project_model = ProjectModel(db_session, project_cache=project_cache)
+    project_exists, points_count = await asyncio.gather(
+        project_model.project_exists(project_id),
+        vector_controller.get_index_points_count(project_id=project_id),
     )
-    index_info = await vector_controller.get_index_info(project_id=project_id)
-    if index_info is None:
-        return JSONResponse(
+    if not project_exists:
+        return ORJSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"msg": ResponseSignals.PROJECT_NOT_FOUND.value},
+        )
+    if points_count is None:
+        return ORJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"msg": ResponseSignals.VECTOR_INDEX_NOT_FOUND.value},
         )
-    if "points_count" not in index_info or index_info["points_count"] < 1:
-        return JSONResponse(
+    if points_count < 1:
+        return ORJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"msg": ResponseSignals.VECTOR_INDEX_EMPTY.value},
         )
@@ -69,53 +116,19 @@ async def generate_with_rag(
         threshold=rag_request.threshold,
     )
 
-    template_controller: TemplateController = request.app.state.template_controller
-    system_prompt = template_controller.get_template("rag", "SYSTEM_PROMPT")
-    if system_prompt is None:
-        template_controller.logger.error(
-            "RAG request failed; Missing RAG templates: SYSTEM_PROMPT"
-        )
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={"msg": ResponseSignals.RAG_GENERATION_FAILED.value},
+    context_buffer = StringIO()
+    for idx, vector in enumerate(relevant_vectors):
+        if idx:
+            context_buffer.write("\n")
+        context_buffer.write(
+            context_template.substitute(index=idx + 1, content=vector.text)
         )
-
-    context_entries = "\n".join(
-        [
-            entry
-            for idx, vector in enumerate(relevant_vectors)
-            if (
-                entry := template_controller.get_template(
-                    "rag",
-                    "CONTEXT_ENTRY",
-                    variables={
-                        "index": idx + 1,
-                        "content": vector.text,
-                    },
-                )
-            )
-            is not None
-        ]
-    )
+    context_entries = context_buffer.getvalue()
     if not context_entries:
         template_controller.logger.error(
-            "RAG request failed; Missing RAG templates: CONTEXT_ENTRY"
-        )
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={"msg": ResponseSignals.RAG_GENERATION_FAILED.value},
-        )
-
-    footer = template_controller.get_template(
-        "rag",
-        "FOOTER",
-        variables={"query": rag_request.query},
-    )
-    if footer is None:
-        template_controller.logger.error(
-            "RAG request failed; Missing RAG templates: FOOTER"
+            "RAG request failed; No context entries were retrieved"
         )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={"msg": ResponseSignals.RAG_GENERATION_FAILED.value},
         )
@@ -124,7 +137,7 @@ async def generate_with_rag(
 
     rag_controller = RAGController(
         settings=settings,
-        generation_model=request.app.state.generation_llm,
+        generation_model=state.generation_llm,
     )
     rag_response = await rag_controller.generate_response(
         query=query_prompt,
@@ -135,7 +148,7 @@ async def generate_with_rag(
 
     if rag_response is None:
         rag_controller.logger.error("RAG generation failed; No response generated")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={"msg": ResponseSignals.RAG_GENERATION_FAILED.value},
         )
@@ -144,11 +157,13 @@ async def generate_with_rag(
         response=rag_response, context_entries=relevant_vectors
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "response": rag_response,
-            "citations": [citation.model_dump() for citation in citations],
-            "contexts": [vector.model_dump() for vector in relevant_vectors],
+            "citations": RETRIEVED_CHUNKS_ADAPTER.dump_python(citations, mode="json"),
+            "contexts": RETRIEVED_CHUNKS_ADAPTER.dump_python(
+                relevant_vectors, mode="json"
+            ),
         },
         status_code=status.HTTP_202_ACCEPTED,
     )
@@ -0,0 +1,66 @@
+"""
+Shared response helpers for Lite-RAG-App API routes
+"""
+
+from functools import lru_cache
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+from models.enums import ResponseSignals
+
+
+@lru_cache(maxsize=None)
+def _encode_signal(signal: ResponseSignals) -> bytes:
+    """Encode a response signal message body once.
+
+    Args:
+        signal (ResponseSignals): The response signal.
+
+    Returns:
+        bytes: The JSON-encoded message body.
+    """
+    return orjson.dumps({"msg": signal.value})
+
+
+def signal_response(signal: ResponseSignals, status_code: int) -> Response:
+    """Build a JSON response carrying a response signal message.
+
+    The body is encoded once per signal; a fresh response is returned on every call \
+        since response objects are mutable and must not be shared across requests.
+
+    Args:
+        signal (ResponseSignals): The response signal.
+        status_code (int): The HTTP status code.
+
+    Returns:
+        Response: The JSON response.
+    """
+    return Response(
+        content=_encode_signal(signal),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def model_response(model: BaseModel, status_code: int) -> Response:
+    """Build a JSON response from a validated response model.
+
+    The model is serialized straight to bytes by pydantic-core, skipping FastAPI's \
+        re-validation of the response model and its `jsonable_encoder` pass.
+
+    Args:
+        model (BaseModel): The validated response model.
+        status_code (int): The HTTP status code.
+
+    Returns:
+        Response: The JSON response.
+    """
+    return Response(
+        content=model.model_dump_json(
+            by_alias=True, exclude_unset=True, exclude_none=True
+        ),
+        status_code=status_code,
+        media_type="application/json",
+    )
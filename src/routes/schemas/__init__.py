@@ -2,6 +2,7 @@
 Pydantic schemas for the API requests and responses.
 """
 
+from routes.schemas.adapters import RETRIEVED_CHUNKS_ADAPTER
 from routes.schemas.assets import (
     AssetListResponse,
     AssetResponse,
@@ -18,6 +19,7 @@ from routes.schemas.projects import (
     ProjectListResponse,
     ProjectResponse,
 )
+from routes.schemas.rag import RAGQueryRequest, RAGQueryResponse
 from routes.schemas.vectors import (
     VectorIndexRequest,
     VectorIndexResponse,
@@ -0,0 +1,11 @@
+"""
+Reusable TypeAdapters for serializing API response payloads.
+"""
+
+from typing import List
+
+from pydantic import TypeAdapter
+
+from models.vector import RetrievedDocumentChunk
+
+RETRIEVED_CHUNKS_ADAPTER = TypeAdapter(List[RetrievedDocumentChunk])
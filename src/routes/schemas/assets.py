@@ -35,7 +35,7 @@ class Asset(BaseModel):
         description="The timestamp when the asset was last updated.",
     )
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
 
 class AssetResponse(BaseModel):
@@ -31,7 +31,7 @@ class Chunk(BaseModel):
         description="The timestamp when the chunk was last updated.",
     )
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
 
 class DocumentProcessingRequest(BaseModel):
@@ -46,6 +46,8 @@ class DocumentProcessingRequest(BaseModel):
         default=False, description="Whether to replace existing chunks for the asset."
     )
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class ProjectDocumentsRefreshRequest(BaseModel):
     """Request schema for project documents refresh."""
@@ -58,6 +60,8 @@ class ProjectDocumentsRefreshRequest(BaseModel):
         default=False, description="Whether to replace all existing chunks."
     )
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class ChunkResponse(BaseModel):
     """Response model for a document chunk."""
@@ -17,6 +17,8 @@ class ProjectCreationRequest(BaseModel):
         default=None, max_length=500, description="The description of the project."
     )
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class Project(BaseModel):
     """Pydantic model for Project."""
@@ -31,7 +33,7 @@ class Project(BaseModel):
         description="The timestamp when the project was last updated.",
     )
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
 
 class ProjectResponse(BaseModel):
@@ -2,9 +2,10 @@
 Pydantic schemas for RAG-related requests and responses.
 """
 
-from typing import List, Optional
+from typing import Annotated, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from typing_extensions import TypedDict
 
 from models.vector import RetrievedDocumentChunk
 
@@ -36,18 +37,23 @@ class RAGQueryRequest(BaseModel):
         description="Optional maximum number of tokens to generate in the LLM output.",
     )
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
-class RAGQueryResponse(BaseModel):
+
+class RAGQueryResponse(TypedDict, total=False):
     """
     Response schema for RAG querying.
     """
 
-    response: Optional[str] = Field(default=None, description="List of RAG response")
-    citations: Optional[List[RetrievedDocumentChunk]] = Field(
-        default=None,
-        description="List of citations within the RAG response (as per the LLM output)",
-    )
-    contexts: Optional[List[RetrievedDocumentChunk]] = Field(
-        default=None, description="List of context documents used in the RAG request"
-    )
-    msg: Optional[str] = Field(default=None, description="Response message")
+    response: Annotated[str, Field(description="The RAG response")]
+    citations: Annotated[
+        List[RetrievedDocumentChunk],
+        Field(
+            description="List of citations within the RAG response (as per the LLM output)"
+        ),
+    ]
+    contexts: Annotated[
+        List[RetrievedDocumentChunk],
+        Field(description="List of context documents used in the RAG request"),
+    ]
+    msg: Annotated[str, Field(description="Response message")]
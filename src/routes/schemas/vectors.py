@@ -2,9 +2,12 @@
 Pydantic schemas for document-related requests and responses.
 """
 
-from typing import List, Optional
+from typing import Annotated, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from typing_extensions import TypedDict
+
+from models.vector import RetrievedDocumentChunk
 
 
 class VectorIndexRequest(BaseModel):
@@ -17,6 +20,8 @@ class VectorIndexRequest(BaseModel):
         description="Whether to reset the index before adding new vectors.",
     )
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class VectorQueryRequest(BaseModel):
     """
@@ -34,22 +39,24 @@ class VectorQueryRequest(BaseModel):
         description="Optional similarity threshold for filtering results.",
     )
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
-class VectorIndexResponse(BaseModel):
+
+class VectorIndexResponse(TypedDict, total=False):
     """
     Response schema for vector indexing.
     """
 
-    msg: Optional[str] = Field(default=None, description="Response message")
+    msg: Annotated[str, Field(description="Response message")]
 
 
-class VectorQueryResponse(BaseModel):
+class VectorQueryResponse(TypedDict, total=False):
     """
     Response schema for vector querying.
     """
 
-    results: Optional[List[BaseModel]] = Field(
-        default=None, description="List of vector search results"
-    )
-    count: Optional[int] = Field(default=None, description="Number of results returned")
-    msg: Optional[str] = Field(default=None, description="Response message")
+    results: Annotated[
+        List[RetrievedDocumentChunk], Field(description="List of vector search results")
+    ]
+    count: Annotated[int, Field(description="Number of results returned")]
+    msg: Annotated[str, Field(description="Response message")]
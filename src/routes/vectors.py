@@ -2,128 +2,131 @@
 API routes for vector-related operations.
 """
 
+import asyncio
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Request, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from controllers import VectorController
-from dependencies import get_session
+from dependencies import (
+    get_project_cache,
+    get_session,
+    get_vector_controller,
+    json_body,
+    json_body_openapi,
+)
 from models.chunk import DocumentChunkModel
 from models.enums import ResponseSignals
 from models.project import ProjectModel
+from routes.responses import signal_response
 from routes.schemas import (
+    RETRIEVED_CHUNKS_ADAPTER,
     VectorIndexRequest,
     VectorIndexResponse,
     VectorQueryRequest,
     VectorQueryResponse,
 )
+from utils.cache import TTLCache
 
 vector_router = APIRouter(
-    prefix="/api/v1/p/{project_id}/vectors", tags=["vectors", "v1"]
+    prefix="/api/v1/p/{project_id}/vectors",
+    tags=["vectors", "v1"],
+    default_response_class=ORJSONResponse,
 )
 
 
-@vector_router.post("/index", response_model=VectorIndexResponse)
+@vector_router.post(
+    "/index",
+    response_model=VectorIndexResponse,
+    openapi_extra=json_body_openapi(VectorIndexRequest),
+)
 async def index_vectors(
-    request: Request,
     project_id: UUID,
-    index_request: VectorIndexRequest,
+    index_request: VectorIndexRequest = Depends(json_body(VectorIndexRequest)),
     db_session: AsyncSession = Depends(get_session),
+    vector_controller: VectorController = Depends(get_vector_controller),
 ):
     """Index vectors for a specific project.
 
     Args:
-        request (Request): The FastAPI request object.
         project_id (UUID): The ID of the project to index vectors for.
         index_request (VectorIndexRequest): The request object containing indexing parameters.
         db_session (AsyncSession): The SQLAlchemy database async session.
+        vector_controller (VectorController): The shared vector controller.
 
     Returns:
         VectorIndexResponse: The response object containing the result of the indexing operation.
     """
-    settings = request.app.state.settings
     project_model = ProjectModel(db_session)
-    project_record = await project_model.get_project_by_id(project_id)
-    if project_record is None:
-        return JSONResponse(
-            status_code=status.HTTP_404_NOT_FOUND,
-            content={"msg": ResponseSignals.PROJECT_NOT_FOUND.value},
+    has_chunks = await project_model.project_has_chunks(project_id)
+    if has_chunks is None:
+        return signal_response(
+            ResponseSignals.PROJECT_NOT_FOUND, status.HTTP_404_NOT_FOUND
         )
-
-    document_chunk_model = DocumentChunkModel(db_session)
-    chunk_count = await document_chunk_model.count_chunks_by_project(project_record.id)
-    if chunk_count == 0:
-        return JSONResponse(
-            content={"msg": ResponseSignals.NO_DOCUMENTS_FOUND.value},
-            status_code=status.HTTP_404_NOT_FOUND,
+    if not has_chunks:
+        return signal_response(
+            ResponseSignals.NO_DOCUMENTS_FOUND, status.HTTP_404_NOT_FOUND
         )
-    chunks = await document_chunk_model.get_chunks_by_project(
-        project_record.id, skip=0, limit=chunk_count
-    )
 
-    vector_controller = VectorController(
-        settings=settings,
-        vectordb_client=request.app.state.vectordb_client,
-        embedding_model=request.app.state.embedding_llm,
-    )
+    document_chunk_model = DocumentChunkModel(db_session)
     inserted = await vector_controller.index_vectors(
-        project_id=project_id, chunks=list(chunks), reset=index_request.reset
+        project_id=project_id,
+        chunk_pages=document_chunk_model.iter_chunk_pages_by_project(project_id),
+        reset=index_request.reset,
     )
     if not inserted:
-        return JSONResponse(
-            content={"msg": ResponseSignals.VECTOR_INDEXING_FAILED.value},
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        return signal_response(
+            ResponseSignals.VECTOR_INDEXING_FAILED,
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
         )
-    return JSONResponse(
+    return ORJSONResponse(
         content={},
         status_code=status.HTTP_201_CREATED,
     )
 
 
-@vector_router.post("/query", response_model=VectorQueryResponse)
+@vector_router.post(
+    "/query",
+    response_model=VectorQueryResponse,
+    openapi_extra=json_body_openapi(VectorQueryRequest),
+)
 async def query_vectors(
-    request: Request,
     project_id: UUID,
-    query_request: VectorQueryRequest,
+    query_request: VectorQueryRequest = Depends(json_body(VectorQueryRequest)),
     db_session: AsyncSession = Depends(get_session),
+    vector_controller: VectorController = Depends(get_vector_controller),
+    project_cache: TTLCache = Depends(get_project_cache),
 ):
     """Query vectors for a specific project.
 
     Args:
-        request (Request): The FastAPI request object.
         project_id (UUID): The ID of the project to query vectors for.
         query_request (VectorQueryRequest): The request object containing query parameters.
         db_session (AsyncSession): The SQLAlchemy database async session.
+        vector_controller (VectorController): The shared vector controller.
+        project_cache (TTLCache): The shared cache of known project IDs.
 
     Returns:
         VectorQueryResponse: The response object containing the result of the query operation.
     """
-    settings = request.app.state.settings
-    project_model = ProjectModel(db_session)
-    project_record = await project_model.get_project_by_id(project_id)
-    if project_record is None:
-        return JSONResponse(
-            status_code=status.HTTP_404_NOT_FOUND,
-            content={"msg": ResponseSignals.PROJECT_NOT_FOUND.value},
-        )
-
-    vector_controller = VectorController(
-        settings=settings,
-        vectordb_client=request.app.state.vectordb_client,
-        embedding_model=request.app.state.embedding_llm,
+    project_model = ProjectModel(db_session, project_cache=project_cache)
+    project_exists, points_count = await asyncio.gather(
+        project_model.project_exists(project_id),
+        vector_controller.get_index_points_count(project_id=project_id),
     )
-    index_info = await vector_controller.get_index_info(project_id=project_id)
-    if index_info is None:
-        return JSONResponse(
-            status_code=status.HTTP_404_NOT_FOUND,
-            content={"msg": ResponseSignals.VECTOR_INDEX_NOT_FOUND.value},
+    if not project_exists:
+        return signal_response(
+            ResponseSignals.PROJECT_NOT_FOUND, status.HTTP_404_NOT_FOUND
+        )
+    if points_count is None:
+        return signal_response(
+            ResponseSignals.VECTOR_INDEX_NOT_FOUND, status.HTTP_404_NOT_FOUND
         )
-    if "points_count" not in index_info or index_info["points_count"] < 1:
-        return JSONResponse(
-            status_code=status.HTTP_404_NOT_FOUND,
-            content={"msg": ResponseSignals.VECTOR_INDEX_EMPTY.value},
+    if points_count < 1:
+        return signal_response(
+            ResponseSignals.VECTOR_INDEX_EMPTY, status.HTTP_404_NOT_FOUND
         )
 
     relevant_vectors = await vector_controller.query_vectors(
@@ -133,9 +136,11 @@ async def query_vectors(
         threshold=query_request.threshold,
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         content={
-            "results": [vector.model_dump() for vector in relevant_vectors],
+            "results": RETRIEVED_CHUNKS_ADAPTER.dump_python(
+                relevant_vectors, mode="json"
+            ),
             "count": len(relevant_vectors),
         },
         status_code=status.HTTP_200_OK,
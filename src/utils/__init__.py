@@ -0,0 +1,6 @@
+"""
+Utilities for Lite-RAG-App
+"""
+
+from utils.cache import TTLCache
+from utils.query_cache import QueryCache
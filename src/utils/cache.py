@@ -0,0 +1,71 @@
+"""
+In-process caching utilities.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    A bounded, in-process LRU cache whose entries expire after a fixed TTL.
+
+    The application runs on a single asyncio event loop, so no locking is done.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        """Initialize the TTLCache.
+
+        Args:
+            maxsize (int): The maximum number of entries to keep.
+            ttl_seconds (float): The number of seconds an entry stays valid.
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value if it exists and has not expired.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            Optional[Any]: The cached value, or None on a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        """Cache a value, evicting the least recently used entry if full.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to cache.
+        """
+        if self.maxsize <= 0 or self.ttl_seconds <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable):
+        """Remove a cached value if present.
+
+        Args:
+            key (Hashable): The cache key.
+        """
+        self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove all cached values."""
+        self._entries.clear()
@@ -0,0 +1,231 @@
+"""
+Cache for vector query results.
+"""
+
+import hashlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from models.vector import RetrievedDocumentChunk
+from utils.cache import TTLCache
+
+
+class QueryCache:
+    """
+    LRU + TTL cache of vector query results keyed by index, query and search parameters.
+
+    Results can be looked up either by the exact (whitespace-normalized) query string, or \
+        semantically by the query embedding: embeddings are bucketed by a random-projection \
+        LSH signature and a bucket entry is reused only if its cosine similarity to the \
+        query embedding reaches the semantic threshold.
+
+    Each index has an epoch that is part of every key; bumping it on writes makes all \
+        previously cached results for that index unreachable without scanning the cache.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl_seconds: float,
+        semantic_bits: int = 16,
+        semantic_threshold: float = 0.95,
+        semantic_bucket_size: int = 8,
+        seed: int = 0,
+    ):
+        """Initialize the QueryCache.
+
+        Args:
+            maxsize (int): The maximum number of cached query results and semantic buckets.
+            ttl_seconds (float): The number of seconds a cached result stays valid.
+            semantic_bits (int, optional): The number of LSH signature bits; 0 disables \
+                semantic lookups. Defaults to 16.
+            semantic_threshold (float, optional): The minimum cosine similarity for a \
+                semantic hit. Defaults to 0.95.
+            semantic_bucket_size (int, optional): The maximum number of entries kept per \
+                LSH bucket. Defaults to 8.
+            seed (int, optional): The seed for the LSH hyperplanes. Defaults to 0.
+        """
+        self._cache = TTLCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+        self._epochs: Dict[str, int] = {}
+        self.semantic_bits = semantic_bits
+        self.semantic_threshold = semantic_threshold
+        self.semantic_bucket_size = semantic_bucket_size
+        self.seed = seed
+        self._hyperplanes: Dict[int, np.ndarray] = {}
+
+    def _make_key(
+        self, index_name: str, query: str, top_k: int, threshold: Optional[float]
+    ) -> bytes:
+        """Build the cache key for a query.
+
+        Args:
+            index_name (str): The name of the queried index.
+            query (str): The query string.
+            top_k (int): The number of top results requested.
+            threshold (Optional[float]): The minimum similarity score, if any.
+
+        Returns:
+            bytes: The cache key.
+        """
+        normalized_query = " ".join(query.split())
+        epoch = self._epochs.get(index_name, 0)
+        raw_key = f"{index_name}|{epoch}|{top_k}|{threshold}|{normalized_query}"
+        return hashlib.blake2b(raw_key.encode(), digest_size=16).digest()
+
+    def _make_semantic_key(
+        self,
+        index_name: str,
+        query_vector: np.ndarray,
+        top_k: int,
+        threshold: Optional[float],
+    ) -> bytes:
+        """Build the LSH bucket key for a unit-length query embedding.
+
+        Args:
+            index_name (str): The name of the queried index.
+            query_vector (np.ndarray): The unit-length query embedding.
+            top_k (int): The number of top results requested.
+            threshold (Optional[float]): The minimum similarity score, if any.
+
+        Returns:
+            bytes: The bucket key.
+        """
+        dimensions = query_vector.shape[0]
+        hyperplanes = self._hyperplanes.get(dimensions)
+        if hyperplanes is None:
+            rng = np.random.default_rng(self.seed)
+            hyperplanes = rng.standard_normal(
+                (dimensions, self.semantic_bits), dtype=np.float32
+            )
+            self._hyperplanes[dimensions] = hyperplanes
+        signature = np.packbits(query_vector @ hyperplanes > 0).tobytes()
+        epoch = self._epochs.get(index_name, 0)
+        raw_key = f"semantic|{index_name}|{epoch}|{top_k}|{threshold}|".encode()
+        return hashlib.blake2b(raw_key + signature, digest_size=16).digest()
+
+    @staticmethod
+    def _to_unit_vector(query_vector: List[float]) -> Optional[np.ndarray]:
+        """Convert an embedding to a unit-length float32 array.
+
+        Args:
+            query_vector (List[float]): The query embedding.
+
+        Returns:
+            Optional[np.ndarray]: The unit-length embedding, or None if it has no magnitude.
+        """
+        vector = np.asarray(query_vector, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+    def get(
+        self, index_name: str, query: str, top_k: int, threshold: Optional[float]
+    ) -> Optional[List[RetrievedDocumentChunk]]:
+        """Get the cached results for a query.
+
+        Args:
+            index_name (str): The name of the queried index.
+            query (str): The query string.
+            top_k (int): The number of top results requested.
+            threshold (Optional[float]): The minimum similarity score, if any.
+
+        Returns:
+            Optional[List[RetrievedDocumentChunk]]: The cached results, or None on a miss.
+        """
+        return self._cache.get(self._make_key(index_name, query, top_k, threshold))
+
+    def set(
+        self,
+        index_name: str,
+        query: str,
+        top_k: int,
+        threshold: Optional[float],
+        results: List[RetrievedDocumentChunk],
+    ):
+        """Cache the results of a query.
+
+        Args:
+            index_name (str): The name of the queried index.
+            query (str): The query string.
+            top_k (int): The number of top results requested.
+            threshold (Optional[float]): The minimum similarity score, if any.
+            results (List[RetrievedDocumentChunk]): The query results.
+        """
+        self._cache.set(self._make_key(index_name, query, top_k, threshold), results)
+
+    def get_similar(
+        self,
+        index_name: str,
+        query_vector: List[float],
+        top_k: int,
+        threshold: Optional[float],
+    ) -> Optional[List[RetrievedDocumentChunk]]:
+        """Get the cached results of a semantically similar query.
+
+        Args:
+            index_name (str): The name of the queried index.
+            query_vector (List[float]): The query embedding.
+            top_k (int): The number of top results requested.
+            threshold (Optional[float]): The minimum similarity score, if any.
+
+        Returns:
+            Optional[List[RetrievedDocumentChunk]]: The cached results of the most similar \
+                query above the semantic threshold, or None on a miss.
+        """
+        if self.semantic_bits <= 0:
+            return None
+        unit_vector = self._to_unit_vector(query_vector)
+        if unit_vector is None:
+            return None
+        bucket: Optional[List[Tuple[np.ndarray, List[RetrievedDocumentChunk]]]] = (
+            self._cache.get(
+                self._make_semantic_key(index_name, unit_vector, top_k, threshold)
+            )
+        )
+        if not bucket:
+            return None
+        best_results = None
+        best_similarity = self.semantic_threshold
+        for cached_vector, results in bucket:
+            similarity = float(cached_vector @ unit_vector)
+            if similarity >= best_similarity:
+                best_similarity = similarity
+                best_results = results
+        return best_results
+
+    def set_similar(
+        self,
+        index_name: str,
+        query_vector: List[float],
+        top_k: int,
+        threshold: Optional[float],
+        results: List[RetrievedDocumentChunk],
+    ):
+        """Cache the results of a query under its embedding's LSH bucket.
+
+        Args:
+            index_name (str): The name of the queried index.
+            query_vector (List[float]): The query embedding.
+            top_k (int): The number of top results requested.
+            threshold (Optional[float]): The minimum similarity score, if any.
+            results (List[RetrievedDocumentChunk]): The query results.
+        """
+        if self.semantic_bits <= 0:
+            return
+        unit_vector = self._to_unit_vector(query_vector)
+        if unit_vector is None:
+            return
+        key = self._make_semantic_key(index_name, unit_vector, top_k, threshold)
+        bucket = self._cache.get(key) or []
+        bucket.append((unit_vector, results))
+        self._cache.set(key, bucket[-self.semantic_bucket_size :])
+
+    def invalidate(self, index_name: str):
+        """Invalidate all cached results for an index.
+
+        Args:
+            index_name (str): The name of the index.
+        """
+        self._epochs[index_name] = self._epochs.get(index_name, 0) + 1
@@ -32,12 +32,26 @@ class VectorDBProviderFactory:
         """
         if provider.upper() == VectorDBProvider.QDRANT.value:
             db_path = self.settings.vectordb_path
-            db_path.mkdir(parents=True, exist_ok=True)
+            if not self.settings.vectordb_url:
+                db_path.mkdir(parents=True, exist_ok=True)
             qdrant_provider = QdrantProvider(
                 path=db_path,
                 distance_metric=SimilarityMetric[
                     self.settings.vectordb_distance_metric.upper()
                 ],
+                scalar_quantization=self.settings.vectordb_scalar_quantization,
+                url=self.settings.vectordb_url or None,
+                grpc_port=self.settings.vectordb_grpc_port,
+                prefer_grpc=self.settings.vectordb_prefer_grpc,
+                max_connections=self.settings.vectordb_http_max_connections,
+                max_keepalive_connections=(
+                    self.settings.vectordb_http_max_keepalive_connections
+                ),
+                timeout=self.settings.vectordb_timeout_seconds,
+                index_list_cache_ttl_seconds=(
+                    self.settings.vectordb_index_list_cache_ttl_seconds
+                ),
+                indexing_threshold=self.settings.vectordb_indexing_threshold,
             )
             return qdrant_provider
         self.logger.error("Unsupported Vector DB provider type: %s", provider)
@@ -3,7 +3,7 @@ Base classes for all Vector DB providers.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import AsyncIterable, Dict, List, Optional, Sequence, Tuple
 
 from models.vector import RetrievedDocumentChunk
 
@@ -23,14 +23,33 @@ class VectorDBProviderInterface(ABC):
 
     @abstractmethod
     async def create_index(
-        self, index_name: str, dimensions: int, replace: bool = False
-    ):
+        self,
+        index_name: str,
+        dimensions: int,
+        replace: bool = False,
+        bulk_load: bool = False,
+    ) -> bool:
         """Create a new index in the Vector DB.
 
         Args:
             index_name (str): The name of the index to create.
             dimensions (int): The dimensionality of the vectors to be stored.
             replace (bool): Whether to replace the index if it exists.
+            bulk_load (bool): Whether to defer building the search index until \
+                `finalize_bulk_load` is called. Defaults to False.
+
+        Returns:
+            bool: True if a new index was created, False if an existing one was kept.
+        """
+
+    @abstractmethod
+    async def finalize_bulk_load(self, index_name: str):
+        """Build the search index of an index created with `bulk_load`.
+
+        Only called for an index that `create_index` actually created.
+
+        Args:
+            index_name (str): The name of the index.
         """
 
     @abstractmethod
@@ -41,6 +60,14 @@ class VectorDBProviderInterface(ABC):
             index_name (str): The name of the index to delete.
         """
 
+    @abstractmethod
+    async def delete_indexes(self, index_names: List[str]):
+        """Delete several indexes from the Vector DB at once.
+
+        Args:
+            index_names (List[str]): The names of the indexes to delete.
+        """
+
     @abstractmethod
     async def index_exists(self, index_name: str) -> bool:
         """Check if an index exists in the Vector DB.
@@ -72,6 +99,18 @@ class VectorDBProviderInterface(ABC):
                 index does not exist.
         """
 
+    @abstractmethod
+    async def get_indexes_info(self, index_names: List[str]) -> List[Optional[Dict]]:
+        """Get information about several indexes at once.
+
+        Args:
+            index_names (List[str]): The names of the indexes to get information about.
+
+        Returns:
+            List[Optional[Dict]]: The information of each index, in the order of \
+                `index_names`; None for indexes that do not exist.
+        """
+
     @abstractmethod
     async def insert_vector(
         self,
@@ -101,6 +140,7 @@ class VectorDBProviderInterface(ABC):
         metadata: Optional[List[Dict]] = None,
         record_ids: Optional[List[str]] = None,
         batch_size: int = 64,
+        max_concurrency: int = 2,
     ) -> bool:
         """Insert vectors into the specified index.
 
@@ -114,9 +154,47 @@ class VectorDBProviderInterface(ABC):
                 Defaults to None.
             batch_size (int, optional): The number of vectors to insert per batch. \
                 Defaults to 64.
+            max_concurrency (int, optional): The maximum number of batches sent to the \
+                vector database at once. Defaults to 2.
+
+        Returns:
+            bool: True if the vectors were inserted successfully, False otherwise.
+
+        Raises:
+            ValueError: If the texts, vectors, metadata or record IDs are inconsistent.
+        """
+
+    @abstractmethod
+    async def insert_stream(
+        self,
+        index_name: str,
+        items: AsyncIterable[
+            Tuple[Optional[str], str, Sequence[float], Optional[Dict]]
+        ],
+        batch_size: int = 64,
+        max_concurrency: int = 2,
+    ) -> bool:
+        """Insert a stream of vectors into the specified index as it is produced.
+
+        Items are buffered into batches of `batch_size` and each full batch is sent \
+            while the next one is being collected, so memory stays bounded regardless \
+            of the stream length.
+
+        Args:
+            index_name (str): The name of the index to insert vectors into.
+            items (AsyncIterable[Tuple[Optional[str], str, Sequence[float], Optional[Dict]]]): \
+                The (record ID, text, vector, metadata) items to insert. A random ID is \
+                generated when the record ID is None.
+            batch_size (int, optional): The number of vectors to insert per batch. \
+                Defaults to 64.
+            max_concurrency (int, optional): The maximum number of batches sent to the \
+                vector database at once. Defaults to 2.
 
         Returns:
             bool: True if the vectors were inserted successfully, False otherwise.
+
+        Raises:
+            ValueError: If the vectors of a batch do not all have the same length.
         """
 
     @abstractmethod
@@ -139,3 +217,25 @@ class VectorDBProviderInterface(ABC):
         Returns:
             List[RetrievedDocumentChunk]: A list of the most similar vectors.
         """
+
+    @abstractmethod
+    async def query_vectors_batch(
+        self,
+        index_name: str,
+        query_vectors: List[List[float]],
+        top_k: int,
+        threshold: Optional[float] = None,
+    ) -> List[List[RetrievedDocumentChunk]]:
+        """Query the specified index for similar vectors of several query vectors at once.
+
+        Args:
+            index_name (str): The name of the index to query.
+            query_vectors (List[List[float]]): The vectors to query against.
+            top_k (int): The number of top similar vectors to return per query.
+            threshold (Optional[float], optional): Minimum similarity score to consider. \
+                Defaults to None.
+
+        Returns:
+            List[List[RetrievedDocumentChunk]]: The most similar vectors of each query, \
+                in the order of the query vectors.
+        """
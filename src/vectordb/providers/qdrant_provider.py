@@ -2,14 +2,43 @@
 Concrete implementation of Vector DB Provider using Qdrant.
 """
 
+import asyncio
 import logging
+import uuid
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import (
+    AsyncIterable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
+import grpc
+import httpx
+import numpy as np
 from qdrant_client import AsyncQdrantClient
-from qdrant_client.models import CollectionDescription, Distance, VectorParams
+from qdrant_client.http.exceptions import UnexpectedResponse
+from qdrant_client.models import (
+    Batch,
+    CollectionDescription,
+    Distance,
+    OptimizersConfigDiff,
+    PointStruct,
+    QueryRequest,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    ScoredPoint,
+    VectorParams,
+)
 
 from models.vector import RetrievedDocumentChunk
+from utils.cache import TTLCache
 from vectordb.models import VectorDBProviderInterface
 from vectordb.models.enums import SimilarityMetric
 
@@ -20,41 +49,148 @@ DISTANCE_MAPPING = {
     SimilarityMetric.MANHATTAN: Distance.MANHATTAN,
 }
 
+# Cache key of the index listing
+_INDEX_LIST_CACHE_KEY = ("__indexes__",)
+
+# Shared by every point inserted without metadata; payloads are only serialized, never mutated
+_EMPTY_METADATA: Dict = {}
+
+
+def _check_dimensions(vectors: Sequence[Sequence[float]]):
+    """Check that all vectors have the same length, without copying them.
+
+    Args:
+        vectors (Sequence[Sequence[float]]): The vectors to check.
+
+    Raises:
+        ValueError: If the vectors do not all have the same length.
+    """
+    lengths = {len(vector) for vector in vectors}
+    if len(lengths) > 1:
+        raise ValueError(
+            f"Vectors must all have the same length, got lengths {sorted(lengths)}."
+        )
+
+
+def _is_not_found(error: Exception) -> bool:
+    """Check whether a Qdrant client error reports a missing collection.
+
+    Args:
+        error (Exception): The error raised by the Qdrant client.
+
+    Returns:
+        bool: True if the error is a not-found error, False otherwise.
+    """
+    if isinstance(error, UnexpectedResponse):
+        return error.status_code == 404
+    if isinstance(error, grpc.RpcError):
+        return error.code() == grpc.StatusCode.NOT_FOUND
+    # The local client reports a missing collection as a plain ValueError
+    return isinstance(error, ValueError) and str(error).endswith("not found")
+
 
 class QdrantProvider(VectorDBProviderInterface):
     """
     Concrete implementation of Vector DB Provider using Qdrant.
     """
 
-    def __init__(self, path: Path, distance_metric: SimilarityMetric):
+    def __init__(
+        self,
+        path: Path,
+        distance_metric: SimilarityMetric,
+        scalar_quantization: bool = False,
+        url: Optional[str] = None,
+        grpc_port: int = 6334,
+        prefer_grpc: bool = True,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 32,
+        timeout: Optional[int] = None,
+        index_list_cache_ttl_seconds: float = 5.0,
+        indexing_threshold: int = 20000,
+    ):
         """Initialize the QdrantProvider.
 
         Args:
-            path (Path): The path to the Qdrant database.
+            path (Path): The path to the local Qdrant database, used when no `url` is set.
             distance_metric (SimilarityMetric): The distance metric to use for vector similarity.
+            scalar_quantization (bool, optional): Whether new indexes keep an int8 quantized \
+                copy of their vectors in RAM for search. Defaults to False.
+            url (Optional[str], optional): The URL of a remote Qdrant server. If None, \
+                the local database at `path` is used. Defaults to None.
+            grpc_port (int, optional): The gRPC port of the remote Qdrant server. \
+                Defaults to 6334.
+            prefer_grpc (bool, optional): Whether to talk to the remote Qdrant server over \
+                gRPC rather than REST. Defaults to True.
+            max_connections (int, optional): The maximum number of pooled REST \
+                connections to the remote Qdrant server. Defaults to 100.
+            max_keepalive_connections (int, optional): The maximum number of idle REST \
+                connections kept alive for reuse. Defaults to 32.
+            timeout (Optional[int], optional): The request timeout for the remote Qdrant \
+                server, in seconds. If None, the client default is used. Defaults to None.
+            index_list_cache_ttl_seconds (float, optional): How long the index listing \
+                is served from cache, in seconds. Defaults to 5.0.
+            indexing_threshold (int, optional): The indexing threshold, in KB, that \
+                indexes created with `bulk_load` get once the load is finalized. \
+                Defaults to 20000, Qdrant's own default.
         """
         self.client: Optional[AsyncQdrantClient] = None
         self.path = path
+        self.url = url
+        self.grpc_port = grpc_port
+        self.prefer_grpc = prefer_grpc
+        self.http_limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self.timeout = timeout
+        self.indexing_threshold = indexing_threshold
         self.distance_metric = DISTANCE_MAPPING[distance_metric]
+        self.quantization_config = (
+            ScalarQuantization(
+                scalar=ScalarQuantizationConfig(type=ScalarType.INT8, always_ram=True)
+            )
+            if scalar_quantization
+            else None
+        )
+        self._known_indexes: Set[str] = set()
+        self._index_list_cache = TTLCache(
+            maxsize=1, ttl_seconds=index_list_cache_ttl_seconds
+        )
         self.logger = logging.getLogger(self.__class__.__name__)
 
     async def connect(self):
         """Connect to the Qdrant service."""
         self.logger.info("Connecting to Qdrant...")
-        self.client = AsyncQdrantClient(path=str(self.path))
+        if self.url:
+            self.client = AsyncQdrantClient(
+                url=self.url,
+                grpc_port=self.grpc_port,
+                prefer_grpc=self.prefer_grpc,
+                timeout=self.timeout,
+                limits=self.http_limits,
+            )
+        else:
+            self.client = AsyncQdrantClient(path=str(self.path))
         info = await self.client.info()
-        self.logger.info("Connected to Qdrant at %s.", self.path)
-        self.logger.info("Qdrant info: %s", info)
+        self.logger.info("Connected to Qdrant at %s.", self.url or self.path)
+        self.logger.debug("Qdrant info: %s", info)
 
     async def disconnect(self):
         """Disconnect from the Qdrant service."""
         self.logger.info("Disconnecting from Qdrant...")
+        if self.client is not None:
+            await self.client.close()
         self.client = None
+        self._known_indexes.clear()
+        self._index_list_cache.clear()
         self.logger.info("Disconnected from Qdrant.")
 
     async def index_exists(self, index_name: str) -> bool:
         """Check if an index exists in the Vector DB.
 
+        Indexes already known to exist are answered locally without a round-trip; \
+            an index is forgotten as soon as Qdrant reports it missing.
+
         Args:
             index_name (str): The name of the index to check.
 
@@ -64,37 +200,107 @@ class QdrantProvider(VectorDBProviderInterface):
         if not self.client:
             self.logger.error("Qdrant client is not initialized.")
             return False
-        return await self.client.collection_exists(collection_name=index_name)
+        if index_name in self._known_indexes:
+            return True
+        exists = await self.client.collection_exists(collection_name=index_name)
+        if exists:
+            self._known_indexes.add(index_name)
+        return exists
 
     async def create_index(
-        self, index_name: str, dimensions: int, replace: bool = False
-    ):
+        self,
+        index_name: str,
+        dimensions: int,
+        replace: bool = False,
+        bulk_load: bool = False,
+    ) -> bool:
         """Create a new index in the Vector DB.
 
         Args:
             index_name (str): The name of the index to create.
             dimensions (int): The dimensionality of the vectors to be stored.
             replace (bool): Whether to replace the index if it exists.
+            bulk_load (bool): Whether to defer building the search index until \
+                `finalize_bulk_load` is called. Defaults to False.
+
+        Returns:
+            bool: True if a new index was created, False if an existing one was kept.
         """
         self.logger.info(
             "Creating index '%s' with dimensions %d...", index_name, dimensions
         )
         if not self.client:
             self.logger.error("Qdrant client is not initialized.")
-            return
-        if await self.index_exists(index_name):
+            return False
+        # Asked directly, as the index may have been deleted outside this provider
+        if await self.client.collection_exists(collection_name=index_name):
+            self._known_indexes.add(index_name)
             if not replace:
                 self.logger.error(
                     "Index '%s' already exists. Skipping index creation...", index_name
                 )
-                return
+                return False
             self.logger.info("Replacing existing index '%s'...", index_name)
             await self.client.delete_collection(collection_name=index_name)
+        self._known_indexes.discard(index_name)
         await self.client.create_collection(
             collection_name=index_name,
             vectors_config=VectorParams(size=dimensions, distance=self.distance_metric),
+            quantization_config=self.quantization_config,
+            optimizers_config=(
+                OptimizersConfigDiff(indexing_threshold=0) if bulk_load else None
+            ),
         )
+        self._known_indexes.add(index_name)
+        self._invalidate_index_list()
         self.logger.info("Index '%s' created successfully.", index_name)
+        return True
+
+    def _invalidate_index_list(self):
+        """Drop the cached index listing."""
+        self._index_list_cache.pop(_INDEX_LIST_CACHE_KEY)
+
+    def _forget_if_missing(self, index_name: str, error: Exception) -> bool:
+        """Forget an index if a Qdrant client error reports it missing.
+
+        Args:
+            index_name (str): The name of the index the failed request targeted.
+            error (Exception): The error raised by the Qdrant client.
+
+        Returns:
+            bool: True if the index was missing, False otherwise.
+        """
+        if not _is_not_found(error):
+            return False
+        self.logger.warning("Index '%s' no longer exists in Qdrant.", index_name)
+        self._known_indexes.discard(index_name)
+        self._invalidate_index_list()
+        return True
+
+    async def finalize_bulk_load(self, index_name: str):
+        """Build the search index of an index created with `bulk_load`.
+
+        Restores the configured indexing threshold so the HNSW graph is built once \
+            over all of the loaded vectors. Only call it for an index that \
+            `create_index` actually created with `bulk_load`.
+
+        Args:
+            index_name (str): The name of the index.
+        """
+        if not self.client:
+            self.logger.error("Qdrant client is not initialized.")
+            return
+        try:
+            await self.client.update_collection(
+                collection_name=index_name,
+                optimizers_config=OptimizersConfigDiff(
+                    indexing_threshold=self.indexing_threshold
+                ),
+            )
+        except Exception:
+            self.logger.exception(
+                "Error finalizing bulk load of index '%s'.", index_name
+            )
 
     async def delete_index(self, index_name: str):
         """Delete an index from the Vector DB.
@@ -108,25 +314,48 @@ class QdrantProvider(VectorDBProviderInterface):
             return
         if await self.index_exists(index_name):
             await self.client.delete_collection(collection_name=index_name)
+            self._known_indexes.discard(index_name)
+            self._invalidate_index_list()
             self.logger.info("Index '%s' deleted successfully.", index_name)
         else:
             self.logger.warning("Index '%s' does not exist.", index_name)
 
+    async def delete_indexes(self, index_names: List[str]):
+        """Delete several indexes from the Vector DB at once.
+
+        The deletions are issued concurrently.
+
+        Args:
+            index_names (List[str]): The names of the indexes to delete.
+        """
+        await asyncio.gather(*(self.delete_index(name) for name in index_names))
+
     async def list_indexes(self) -> List[CollectionDescription]:
         """List all indexes in the Vector DB.
 
+        The listing is served from a short-lived cache when available. The cached list \
+            itself is returned, so callers must not mutate it.
+
         Returns:
             List[CollectionDescription]: A list of indexes available in the vector database.
         """
         if not self.client:
             self.logger.error("Qdrant client is not initialized.")
             return []
-        collections = await self.client.get_collections()
-        return [collection for collection in collections.collections]
+        indexes = self._index_list_cache.get(_INDEX_LIST_CACHE_KEY)
+        if indexes is None:
+            collections = await self.client.get_collections()
+            indexes = collections.collections
+            self._index_list_cache.set(_INDEX_LIST_CACHE_KEY, indexes)
+        return indexes
 
     async def get_index_info(self, index_name: str) -> Optional[Dict]:
         """Get information about a specific index.
 
+        The info is always fetched from Qdrant; callers that need to avoid the \
+            round-trip cache the fields they use, as the vector controller does for \
+            the points count.
+
         Args:
             index_name (str): The name of the index to get information about.
 
@@ -140,9 +369,30 @@ class QdrantProvider(VectorDBProviderInterface):
         if not await self.index_exists(index_name):
             self.logger.error("Index '%s' does not exist.", index_name)
             return None
-        collection = await self.client.get_collection(collection_name=index_name)
+        try:
+            collection = await self.client.get_collection(collection_name=index_name)
+        except Exception as e:
+            if self._forget_if_missing(index_name, e):
+                return None
+            raise
         return collection.model_dump()
 
+    async def get_indexes_info(self, index_names: List[str]) -> List[Optional[Dict]]:
+        """Get information about several indexes at once.
+
+        The lookups are issued concurrently.
+
+        Args:
+            index_names (List[str]): The names of the indexes to get information about.
+
+        Returns:
+            List[Optional[Dict]]: The information of each index, in the order of \
+                `index_names`; None for indexes that do not exist.
+        """
+        return list(
+            await asyncio.gather(*(self.get_index_info(name) for name in index_names))
+        )
+
     async def insert_vector(
         self,
         index_name: str,
@@ -169,103 +419,333 @@ class QdrantProvider(VectorDBProviderInterface):
             return
 
         try:
-            self.client.upload_collection(
+            await self.client.upsert(
                 collection_name=index_name,
-                ids=[record_id] if record_id else None,
-                vectors=[vector],
-                payload=[
-                    {
-                        "text": text,
-                        "metadata": metadata,
-                    }
+                points=[
+                    PointStruct(
+                        id=record_id or uuid.uuid4().hex,
+                        vector=vector,
+                        payload={"text": text, "metadata": metadata},
+                    )
                 ],
                 wait=True,
             )
         except Exception as e:
-            self.logger.error(
-                "Error inserting vector into index '%s': %s",
-                index_name,
-                e,
-                exc_info=True,
-            )
+            self._forget_if_missing(index_name, e)
+            self.logger.exception("Error inserting vector into index '%s'.", index_name)
+
+    def _build_batch(
+        self,
+        texts: Sequence[str],
+        vectors: Union[Sequence[Sequence[float]], np.ndarray],
+        metadata: Optional[Sequence[Dict]],
+        record_ids: Optional[Sequence[str]],
+    ) -> Batch:
+        """Build the columnar batch of a single insert batch.
+
+        The batch is constructed without validation, as its IDs, vectors and payloads \
+            are all checked or produced by this provider. List vectors are used as they \
+            are; only arrays are converted, as the upsert request needs lists.
+
+        Args:
+            texts (Sequence[str]): The texts of the batch.
+            vectors (Union[Sequence[Sequence[float]], np.ndarray]): The vectors of the \
+                batch, as lists or a 2-D array.
+            metadata (Optional[Sequence[Dict]]): The metadata of the batch, if any.
+            record_ids (Optional[Sequence[str]]): The record IDs of the batch. \
+                Random UUIDs are generated if None.
+
+        Returns:
+            Batch: The batch to upsert.
+        """
+        return Batch.model_construct(
+            ids=(
+                list(record_ids)
+                if record_ids is not None
+                else [uuid.uuid4().hex for _ in texts]
+            ),
+            vectors=vectors.tolist() if isinstance(vectors, np.ndarray) else vectors,
+            payloads=[
+                {"text": text, "metadata": item_metadata}
+                for text, item_metadata in zip(
+                    texts,
+                    metadata if metadata is not None else repeat(_EMPTY_METADATA),
+                )
+            ],
+        )
+
+    async def _upsert_batch(
+        self,
+        index_name: str,
+        texts: Sequence[str],
+        vectors: Union[Sequence[Sequence[float]], np.ndarray],
+        metadata: Optional[Sequence[Dict]],
+        record_ids: Optional[Sequence[str]],
+        semaphore: asyncio.Semaphore,
+        wait: bool = False,
+    ):
+        """Build and upsert a single insert batch.
+
+        The points are only built once a slot is acquired, so at most as many batches \
+            as the semaphore allows are materialized at once.
+
+        Args:
+            index_name (str): The name of the index to upsert the points into.
+            texts (Sequence[str]): The texts of the batch.
+            vectors (Union[Sequence[Sequence[float]], np.ndarray]): The vectors of the \
+                batch, as lists or a 2-D array.
+            metadata (Optional[Sequence[Dict]]): The metadata of the batch, if any.
+            record_ids (Optional[Sequence[str]]): The record IDs of the batch, if any.
+            semaphore (asyncio.Semaphore): The semaphore bounding concurrent upserts.
+            wait (bool, optional): Whether to wait for the batch to be applied. \
+                Defaults to False.
+        """
+        assert self.client is not None
+        async with semaphore:
+            try:
+                await self.client.upsert(
+                    collection_name=index_name,
+                    points=self._build_batch(texts, vectors, metadata, record_ids),
+                    wait=wait,
+                )
+            except Exception as e:
+                self._forget_if_missing(index_name, e)
+                raise
 
     async def insert_vectors(
         self,
         index_name: str,
         texts: List[str],
-        vectors: List[List[float]],
+        vectors: Union[List[List[float]], np.ndarray],
         metadata: Optional[List[Dict]] = None,
         record_ids: Optional[List[str]] = None,
         batch_size: int = 64,
+        max_concurrency: int = 2,
     ) -> bool:
         """Insert vectors into the specified index.
 
         Args:
             index_name (str): The name of the index to insert vectors into.
             texts (List[str]): A list of texts associated with the vectors.
-            vectors (List[List[float]]): A list of vectors to insert.
+            vectors (Union[List[List[float]], np.ndarray]): The vectors to insert, as \
+                lists or a 2-D array. Lists are sent as they are, without copying.
             metadata (Optional[List[Dict]], optional): A list of metadata dictionaries to \
                 associate with the vectors. Defaults to None.
             record_ids (Optional[List[str]], optional): A list of record IDs to insert. \
                 Defaults to None.
             batch_size (int, optional): The number of vectors to insert per batch. \
                 Defaults to 64.
+            max_concurrency (int, optional): The maximum number of batches sent to the \
+                vector database at once. Defaults to 2.
 
         Returns:
             bool: True if the vectors were inserted successfully, False otherwise.
+
+        Raises:
+            ValueError: If the texts, vectors, metadata or record IDs are inconsistent.
         """
+        if len(texts) != len(vectors):
+            raise ValueError(
+                f"Length of texts ({len(texts)}) does not match length of vectors "
+                f"({len(vectors)})."
+            )
+        if metadata and len(metadata) != len(vectors):
+            raise ValueError(
+                f"Length of metadata ({len(metadata)}) does not match length of vectors "
+                f"({len(vectors)})."
+            )
+        if record_ids and len(record_ids) != len(vectors):
+            raise ValueError(
+                f"Length of record_ids ({len(record_ids)}) does not match length of "
+                f"vectors ({len(vectors)})."
+            )
         if not self.client:
             self.logger.error("Qdrant client is not initialized.")
             return False
         if not await self.index_exists(index_name):
             self.logger.error("Index '%s' does not exist.", index_name)
             return False
-        if metadata and len(metadata) != len(vectors):
-            self.logger.error(
-                "Length of metadata (%d) does not match length of vectors (%d).",
-                len(metadata),
-                len(vectors),
+        if isinstance(vectors, np.ndarray):
+            if vectors.size and vectors.ndim != 2:
+                raise ValueError(
+                    f"Vectors must form a 2-D array, got {vectors.ndim} dimension(s)."
+                )
+        else:
+            _check_dimensions(vectors)
+        if not texts:
+            return True
+        offsets = range(0, len(texts), batch_size)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        try:
+            await asyncio.gather(
+                *(
+                    self._upsert_batch(
+                        index_name,
+                        texts[start : start + batch_size],
+                        vectors[start : start + batch_size],
+                        metadata[start : start + batch_size] if metadata else None,
+                        record_ids[start : start + batch_size] if record_ids else None,
+                        semaphore,
+                    )
+                    for start in offsets[:-1]
+                )
             )
-            return False
-        if len(texts) != len(vectors):
-            self.logger.error(
-                "Length of texts (%d) does not match length of vectors (%d).",
-                len(texts),
-                len(vectors),
+            # Updates are applied in order, so waiting on the last batch waits on all of them
+            start = offsets[-1]
+            await self._upsert_batch(
+                index_name,
+                texts[start:],
+                vectors[start:],
+                metadata[start:] if metadata else None,
+                record_ids[start:] if record_ids else None,
+                semaphore,
+                wait=True,
             )
-            return False
-        if record_ids and len(record_ids) != len(vectors):
-            self.logger.error(
-                "Length of record_ids (%d) does not match length of vectors (%d).",
-                len(record_ids),
-                len(vectors),
+        except Exception:
+            self.logger.exception(
+                "Error inserting vectors into index '%s'.", index_name
             )
             return False
+        return True
+
+    async def insert_stream(
+        self,
+        index_name: str,
+        items: AsyncIterable[
+            Tuple[Optional[str], str, Sequence[float], Optional[Dict]]
+        ],
+        batch_size: int = 64,
+        max_concurrency: int = 2,
+    ) -> bool:
+        """Insert a stream of vectors into the specified index as it is produced.
+
+        Items are buffered into batches of `batch_size` and each full batch is sent \
+            while the next one is being collected, so memory stays bounded regardless \
+            of the stream length.
+
+        Args:
+            index_name (str): The name of the index to insert vectors into.
+            items (AsyncIterable[Tuple[Optional[str], str, Sequence[float], Optional[Dict]]]): \
+                The (record ID, text, vector, metadata) items to insert. A random ID is \
+                generated when the record ID is None.
+            batch_size (int, optional): The number of vectors to insert per batch. \
+                Defaults to 64.
+            max_concurrency (int, optional): The maximum number of batches sent to the \
+                vector database at once. Defaults to 2.
+
+        Returns:
+            bool: True if the vectors were inserted successfully, False otherwise.
+
+        Raises:
+            ValueError: If the vectors of a batch do not all have the same length.
+        """
+        if not self.client:
+            self.logger.error("Qdrant client is not initialized.")
+            return False
+        if not await self.index_exists(index_name):
+            self.logger.error("Index '%s' does not exist.", index_name)
+            return False
+        semaphore = asyncio.Semaphore(max_concurrency)
+        pending: Set[asyncio.Task] = set()
+        batch: List[Tuple[Optional[str], str, Sequence[float], Optional[Dict]]] = []
         try:
-            self.client.upload_collection(
-                collection_name=index_name,
-                ids=record_ids if record_ids else None,
-                vectors=vectors,
-                payload=[
-                    {
-                        "text": text,
-                        "metadata": metadata,
-                    }
-                    for text, metadata in zip(texts, metadata or [{}] * len(texts))
-                ],
-                batch_size=batch_size,
-                wait=True,
-            )
+            async for item in items:
+                if len(batch) == batch_size:
+                    if len(pending) >= max_concurrency:
+                        done, pending = await asyncio.wait(
+                            pending, return_when=asyncio.FIRST_COMPLETED
+                        )
+                        for task in done:
+                            task.result()
+                    pending.add(
+                        asyncio.create_task(
+                            self._upsert_items(index_name, batch, semaphore)
+                        )
+                    )
+                    batch = []
+                batch.append(item)
+            await asyncio.gather(*pending)
+            pending = set()
+            # The last batch is held back so waiting on it waits on all earlier batches
+            if batch:
+                await self._upsert_items(index_name, batch, semaphore, wait=True)
         except Exception as e:
-            self.logger.error(
-                "Error inserting vectors into index '%s': %s",
-                index_name,
-                e,
-                exc_info=True,
+            if isinstance(e, ValueError) and not _is_not_found(e):
+                raise
+            self.logger.exception(
+                "Error inserting vector stream into index '%s'.", index_name
             )
             return False
+        finally:
+            for task in pending:
+                task.cancel()
         return True
 
+    async def _upsert_items(
+        self,
+        index_name: str,
+        items: List[Tuple[Optional[str], str, Sequence[float], Optional[Dict]]],
+        semaphore: asyncio.Semaphore,
+        wait: bool = False,
+    ):
+        """Upsert a batch of streamed (record ID, text, vector, metadata) items.
+
+        Args:
+            index_name (str): The name of the index to upsert the items into.
+            items (List[Tuple[Optional[str], str, Sequence[float], Optional[Dict]]]): \
+                The items of the batch.
+            semaphore (asyncio.Semaphore): The semaphore bounding concurrent upserts.
+            wait (bool, optional): Whether to wait for the batch to be applied. \
+                Defaults to False.
+
+        Raises:
+            ValueError: If the vectors of the batch do not all have the same length.
+        """
+        vectors = [item[2] for item in items]
+        _check_dimensions(vectors)
+        await self._upsert_batch(
+            index_name,
+            texts=[item[1] for item in items],
+            vectors=vectors,
+            metadata=[
+                item[3] if item[3] is not None else _EMPTY_METADATA for item in items
+            ],
+            record_ids=[
+                item[0] if item[0] is not None else uuid.uuid4().hex for item in items
+            ],
+            semaphore=semaphore,
+            wait=wait,
+        )
+
+    def _to_retrieved_chunks(
+        self, points: List[ScoredPoint]
+    ) -> List[RetrievedDocumentChunk]:
+        """Convert scored Qdrant points to retrieved document chunks.
+
+        Args:
+            points (List[ScoredPoint]): The scored points returned by a query.
+
+        Returns:
+            List[RetrievedDocumentChunk]: The retrieved document chunks.
+        """
+        return [
+            RetrievedDocumentChunk.model_construct(
+                id=point.id,
+                text=(
+                    point.payload["text"]
+                    if point.payload and "text" in point.payload
+                    else ""
+                ),
+                score=point.score,
+                metadata=(
+                    point.payload["metadata"]
+                    if point.payload and "metadata" in point.payload
+                    else {}
+                ),
+            )
+            for point in points
+        ]
+
     async def query_vectors(
         self,
         index_name: str,
@@ -292,34 +772,68 @@ class QdrantProvider(VectorDBProviderInterface):
             self.logger.error("Index '%s' does not exist.", index_name)
             return []
         try:
-            results = await self.client.search(
+            response = await self.client.query_points(
                 collection_name=index_name,
-                query_vector=query_vector,
+                query=np.asarray(query_vector, dtype=np.float32),
                 limit=top_k,
+                score_threshold=threshold,
+                with_payload=True,
+            )
+            return self._to_retrieved_chunks(response.points)
+        except Exception as e:
+            self._forget_if_missing(index_name, e)
+            self.logger.exception("Error querying vectors from index '%s'.", index_name)
+            return []
+
+    async def query_vectors_batch(
+        self,
+        index_name: str,
+        query_vectors: List[List[float]],
+        top_k: int,
+        threshold: Optional[float] = None,
+    ) -> List[List[RetrievedDocumentChunk]]:
+        """Query the specified index for similar vectors of several query vectors at once.
+
+        All queries are sent in a single request.
+
+        Args:
+            index_name (str): The name of the index to query.
+            query_vectors (List[List[float]]): The vectors to query against.
+            top_k (int): The number of top similar vectors to return per query.
+            threshold (Optional[float], optional): Minimum similarity score to consider. \
+                Defaults to None.
+
+        Returns:
+            List[List[RetrievedDocumentChunk]]: The most similar vectors of each query, \
+                in the order of the query vectors.
+        """
+        if not self.client:
+            self.logger.error("Qdrant client is not initialized.")
+            return []
+        if not await self.index_exists(index_name):
+            self.logger.error("Index '%s' does not exist.", index_name)
+            return []
+        if not query_vectors:
+            return []
+        try:
+            responses = await self.client.query_batch_points(
+                collection_name=index_name,
+                requests=[
+                    QueryRequest(
+                        query=query_vector,
+                        limit=top_k,
+                        score_threshold=threshold,
+                        with_payload=True,
+                    )
+                    for query_vector in query_vectors
+                ],
             )
             return [
-                RetrievedDocumentChunk(
-                    id=result.id,
-                    text=(
-                        result.payload["text"]
-                        if result.payload and "text" in result.payload
-                        else ""
-                    ),
-                    score=result.score,
-                    metadata=(
-                        result.payload["metadata"]
-                        if result.payload and "metadata" in result.payload
-                        else {}
-                    ),
-                )
-                for result in results
-                if threshold is None or (result.score and result.score >= threshold)
+                self._to_retrieved_chunks(response.points) for response in responses
             ]
         except Exception as e:
-            self.logger.error(
-                "Error querying vectors from index '%s': %s",
-                index_name,
-                e,
-                exc_info=True,
+            self._forget_if_missing(index_name, e)
+            self.logger.exception(
+                "Error batch querying vectors from index '%s'.", index_name
             )
             return []